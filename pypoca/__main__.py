@@ -1,27 +1,33 @@
 # -*- coding: utf-8 -*-
-import os
-
 import disnake
 from disnake.ext import commands
 
-from pypoca.config import DB_CREDENTIALS, DEBUG, GUILDS_ID, TOKEN
-from pypoca.database import db
+from pypoca.bot import Bot, ShardedBot
+from pypoca.config import CLUSTER, DB_CREDENTIALS, DEBUG, GUILDS_ID, SHARDING, TOKEN
+from pypoca.database import Server, db
+from pypoca.imports import cogs
 
 
-def load_extensions(bot: commands.Bot, folder: str) -> None:
-    for filename in os.listdir(folder):
-        if filename.endswith(".py") and not filename.startswith("_"):
-            bot.load_extension(f"{folder}/{filename[:-3]}".replace("/", "."))
+def load_extensions(bot: commands.Bot) -> None:
+    for name in cogs():
+        bot.load_extension(name)
 
 
 def main() -> None:
     db_credentials = {k: v for k, v in DB_CREDENTIALS.items() if v is not None}
     test_guilds = [int(guild_id) for guild_id in GUILDS_ID.split(",")] if DEBUG else None
+    shards = {}
+    if SHARDING["shard_count"]:
+        shards["shard_count"] = SHARDING["shard_count"]
+    if SHARDING["shard_ids"]:
+        shards["shard_ids"] = [int(shard_id) for shard_id in SHARDING["shard_ids"].split(",")]
 
     db.bind(**db_credentials)
     db.generate_mapping(create_tables=True)
+    Server.preload()
 
-    bot = commands.Bot(
+    bot_class = ShardedBot if SHARDING["sharded"] else Bot
+    bot = bot_class(
         activity=disnake.Activity(type=disnake.ActivityType.watching, name="/help"),
         case_insensitive=True,
         command_prefix=commands.when_mentioned,
@@ -29,12 +35,13 @@ def main() -> None:
         help_command=None,
         reload=DEBUG,
         strict_localization=True,
-        sync_commands=True,
+        sync_commands=CLUSTER["id"] == 0,
         sync_commands_debug=DEBUG,
         test_guilds=test_guilds,
+        **shards,
     )
     # bot.i18n.load("pypoca/locale")
-    load_extensions(bot, "pypoca/cogs")
+    load_extensions(bot)
     bot.run(TOKEN)
 
 
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import json
+import math
+import os
+
+import disnake
+from disnake.ext import commands, tasks
+
+from pypoca import database
+from pypoca.config import CATALOG_REFRESH_INTERVAL, CLUSTER, DB_FLUSH_INTERVAL, TITLE_INDEX, TMDB_DISK_CACHE
+from pypoca.ext import ALL, DEFAULT_LANGUAGE, DEFAULT_REGION, Deadline
+from pypoca.log import log
+from pypoca.services import enrichment, http, tmdb
+from pypoca.services.catalog import catalog
+
+
+@tasks.loop(seconds=TMDB_DISK_CACHE["compact_interval"])
+async def compact_caches() -> None:
+    try:
+        await asyncio.to_thread(tmdb.TMDb.disk.compact)
+    except Exception as e:
+        log.error(f"Failed to compact the TMDb disk cache. {e}", exc_info=e)
+
+
+@tasks.loop(seconds=DB_FLUSH_INTERVAL)
+async def flush_stats() -> None:
+    await database.stats.flush()
+
+
+@tasks.loop(seconds=CATALOG_REFRESH_INTERVAL)
+async def refresh_catalog() -> None:
+    await catalog.refresh(languages=list(ALL), regions=sorted({language[3:] for language in ALL}))
+
+
+@tasks.loop(seconds=TITLE_INDEX["refresh_interval"])
+async def refresh_titles() -> None:
+    movies = tmdb.Movies(language=DEFAULT_LANGUAGE, region=DEFAULT_REGION)
+    shows = tmdb.Shows(language=DEFAULT_LANGUAGE, region=DEFAULT_REGION)
+    people = tmdb.People(language=DEFAULT_LANGUAGE, region=DEFAULT_REGION)
+    pages = await asyncio.gather(
+        movies.popular(), movies.top_rated(), movies.trending(),
+        shows.popular(), shows.top_rated(), shows.trending(),
+        people.popular(), people.trending(),
+        return_exceptions=True,
+    )
+    for media_type, results in (("movie", pages[:3]), ("tv", pages[3:6])):
+        ids = [item["id"] for page in results if isinstance(page, dict) for item in page.get("results", [])]
+        await enrichment.preload(media_type, ids)
+
+
+@tasks.loop(seconds=CLUSTER["heartbeat_interval"])
+async def report_health(bot: commands.Bot) -> None:
+    latencies = getattr(bot, "latencies", None) or [(0, bot.latency)]
+    health = {
+        "cluster": CLUSTER["id"],
+        "ready": bot.is_ready(),
+        "guilds": len(bot.guilds),
+        "shards": {str(shard_id): latency if math.isfinite(latency) else None for shard_id, latency in latencies},
+    }
+    os.write(CLUSTER["health_fd"], (json.dumps(health) + "\n").encode())
+
+
+class BotMixin:
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.before_slash_command_invoke(self.start_deadline)
+        self.after_slash_command_invoke(self.stop_deadline)
+
+    async def start_deadline(self, inter: disnake.ApplicationCommandInteraction) -> None:
+        Deadline(inter).start()
+
+    async def stop_deadline(self, inter: disnake.ApplicationCommandInteraction) -> None:
+        deadline = http.deadline.get()
+        if deadline is not None:
+            deadline.stop()
+
+    async def start(self, *args, **kwargs) -> None:
+        http.client.open()
+        compact_caches.start()
+        flush_stats.start()
+        refresh_catalog.start()
+        refresh_titles.start()
+        if CLUSTER["health_fd"] >= 0:
+            report_health.start(self)
+        await super().start(*args, **kwargs)
+
+    async def close(self) -> None:
+        compact_caches.cancel()
+        flush_stats.cancel()
+        refresh_catalog.cancel()
+        refresh_titles.cancel()
+        report_health.cancel()
+        await super().close()
+        await database.stats.flush()
+        await http.client.close()
+        tmdb.TMDb.disk.close()
+        database.executor.shutdown(wait=True)
+
+
+class Bot(BotMixin, commands.Bot):
+    pass
+
+
+class ShardedBot(BotMixin, commands.AutoShardedBot):
+    pass
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import json
+import math
+import os
+import signal
+import sys
+import time
+import urllib.request
+
+from aiohttp import web
+
+from pypoca.config import CLUSTER, RATE_LIMITS, SHARDING, TOKEN
+from pypoca.log import log
+
+
+def recommended_shards() -> int:
+    request = urllib.request.Request(
+        "https://discord.com/api/v10/gateway/bot",
+        headers={"Authorization": f"Bot {TOKEN}", "User-Agent": "PyPoca (https://github.com/leandcesar/PyPoca)"},
+    )
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return json.load(response)["shards"]
+
+
+def shard_ranges(shard_count: int, clusters: int) -> list[list[int]]:
+    size = math.ceil(shard_count / max(1, clusters))
+    return [list(range(start, min(start + size, shard_count))) for start in range(0, shard_count, size)]
+
+
+def rate_limits(clusters: int) -> dict:
+    env = {}
+    for name, limits in RATE_LIMITS.items():
+        env[f"{name.upper()}_RATE_LIMIT"] = str(limits["rate"] / clusters)
+        env[f"{name.upper()}_RATE_BURST"] = str(max(1, limits["burst"] // clusters))
+    return env
+
+
+class Cluster:
+    def __init__(self, id: int, *, shard_ids: list[int], shard_count: int, clusters: int) -> None:
+        self.id = id
+        self.shard_ids = shard_ids
+        self.shard_count = shard_count
+        self.clusters = clusters
+        self.process = None
+        self.health = {}
+        self.heartbeat = 0.0
+        self.restarts = 0
+        self.failures = 0
+
+    @property
+    def running(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+    @property
+    def healthy(self) -> bool:
+        return self.running and time.monotonic() - self.heartbeat < CLUSTER["heartbeat_timeout"]
+
+    def env(self, health_fd: int) -> dict:
+        return {
+            **os.environ,
+            **rate_limits(self.clusters),
+            "SHARDED": "1",
+            "SHARD_COUNT": str(self.shard_count),
+            "SHARD_IDS": ",".join(str(shard_id) for shard_id in self.shard_ids),
+            "CLUSTER_ID": str(self.id),
+            "CLUSTER_HEALTH_FD": str(health_fd),
+        }
+
+    def status(self) -> dict:
+        return {
+            "id": self.id,
+            "shard_ids": self.shard_ids,
+            "pid": self.process.pid if self.running else None,
+            "healthy": self.healthy,
+            "restarts": self.restarts,
+            "heartbeat_age": round(time.monotonic() - self.heartbeat, 1) if self.heartbeat else None,
+            **self.health,
+        }
+
+    async def read(self, fd: int) -> None:
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        transport, _ = await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), os.fdopen(fd, "rb"))
+        try:
+            async for line in reader:
+                try:
+                    self.health = json.loads(line)
+                except ValueError:
+                    continue
+                self.heartbeat = time.monotonic()
+        finally:
+            transport.close()
+
+    async def run(self, stopping: asyncio.Event) -> None:
+        while not stopping.is_set():
+            read_fd, write_fd = os.pipe()
+            self.process = await asyncio.create_subprocess_exec(
+                sys.executable, "-m", "pypoca", env=self.env(write_fd), pass_fds=(write_fd,)
+            )
+            os.close(write_fd)
+            self.health = {}
+            self.heartbeat = started = time.monotonic()
+            log.info(f"Cluster {self.id} started (pid {self.process.pid}, shards {self.shard_ids})")
+            reader = asyncio.ensure_future(self.read(read_fd))
+            code = await self.process.wait()
+            reader.cancel()
+            self.health = {}
+            if stopping.is_set():
+                break
+            self.restarts += 1
+            self.failures = 0 if time.monotonic() - started > CLUSTER["heartbeat_timeout"] else self.failures + 1
+            delay = min(CLUSTER["restart_delay"] * max(1, self.failures), 300)
+            log.warning(f"Cluster {self.id} exited with code {code}, restarting in {delay}s")
+            await asyncio.sleep(delay)
+
+    def stop(self) -> None:
+        if self.running:
+            self.process.terminate()
+
+    def kill(self) -> None:
+        if self.running:
+            self.process.kill()
+
+
+class Launcher:
+    def __init__(self) -> None:
+        shard_count = SHARDING["shard_count"] or recommended_shards()
+        self.shard_count = shard_count
+        ranges = shard_ranges(shard_count, CLUSTER["count"])
+        self.clusters = [
+            Cluster(id, shard_ids=shard_ids, shard_count=shard_count, clusters=len(ranges))
+            for id, shard_ids in enumerate(ranges)
+        ]
+        self.stopping = None
+
+    def health(self) -> dict:
+        clusters = [cluster.status() for cluster in self.clusters]
+        return {
+            "healthy": all(cluster["healthy"] for cluster in clusters),
+            "shard_count": self.shard_count,
+            "guilds": sum(cluster.get("guilds", 0) for cluster in clusters),
+            "clusters": clusters,
+        }
+
+    async def watch(self) -> None:
+        while not self.stopping.is_set():
+            await asyncio.sleep(CLUSTER["heartbeat_interval"])
+            for cluster in self.clusters:
+                if cluster.running and not cluster.healthy:
+                    log.warning(f"Cluster {cluster.id} missed heartbeats for {CLUSTER['heartbeat_timeout']}s, killing it")
+                    cluster.kill()
+            health = self.health()
+            log.info(
+                f"{sum(cluster['healthy'] for cluster in health['clusters'])}/{len(self.clusters)} clusters healthy, "
+                f"{health['guilds']} guilds"
+            )
+
+    async def serve(self) -> web.AppRunner:
+        async def handle(request: web.Request) -> web.Response:
+            health = self.health()
+            return web.json_response(health, status=200 if health["healthy"] else 503)
+
+        app = web.Application()
+        app.router.add_get("/health", handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, port=CLUSTER["health_port"]).start()
+        return runner
+
+    def stop(self) -> None:
+        self.stopping.set()
+        for cluster in self.clusters:
+            cluster.stop()
+
+    async def run(self) -> None:
+        self.stopping = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, self.stop)
+        runner = await self.serve() if CLUSTER["health_port"] else None
+        watcher = asyncio.ensure_future(self.watch())
+        log.info(f"Launching {len(self.clusters)} clusters for {self.shard_count} shards")
+        try:
+            await asyncio.gather(*(cluster.run(self.stopping) for cluster in self.clusters))
+        finally:
+            watcher.cancel()
+            if runner is not None:
+                await runner.cleanup()
+
+
+def main() -> None:
+    asyncio.run(Launcher().run())
+
+
+if __name__ == "__main__":
+    main()
@@ -5,11 +5,31 @@ import random
 import disnake
 from disnake.ext import commands
 
-from pypoca.config import COLOR
+from pypoca import database
+from pypoca.config import COLOR, GAME_POOL
 from pypoca.database import Server
 from pypoca.exceptions import NoResults
-from pypoca.services import tmdb, trakt
-from pypoca.ext import ALL, DEFAULT, DEFAULT_LANGUAGE, DEFAULT_REGION, Choice, Movie, Option, Show
+from pypoca.services import http, tmdb
+from pypoca.services.pool import CandidatePool
+from pypoca.ext import ALL, DEFAULT, DEFAULT_LANGUAGE, DEFAULT_REGION, Choice, Deadline, Movie, Option, Show
+
+POOLS = {}
+
+
+async def load_candidate(*, language: str, region: str) -> Movie:
+    response = await tmdb.Movies(language=language, region=region).random(append="images,similar")
+    movie = Movie(response)
+    if movie.image and movie.backdrops and len(movie.similar) >= 4:
+        return movie
+
+
+def candidates(*, language: str, region: str) -> CandidatePool:
+    key = (language, region)
+    if key not in POOLS:
+        POOLS[key] = CandidatePool(
+            lambda: load_candidate(language=language, region=region), low=GAME_POOL["low"], high=GAME_POOL["high"]
+        )
+    return POOLS[key]
 
 
 class Game:
@@ -25,13 +45,11 @@ class Game:
         self.images = []
         self.embed = None
         self.view = None
+        self.upcoming = None
 
-        self.server = Server.get_or_create(
-            id=self.inter.guild.id,
-            data={"language": DEFAULT_LANGUAGE, "region": DEFAULT_REGION, "frame_record": 0, "higher_record": 0}
-        )
-        self.language = self.server.language or DEFAULT_LANGUAGE
-        self.region = self.server.region or DEFAULT_REGION
+        self.server = Server.get_by_id(self.inter.guild.id)
+        self.language = (self.server.language or DEFAULT_LANGUAGE) if self.server else DEFAULT_LANGUAGE
+        self.region = (self.server.region or DEFAULT_REGION) if self.server else DEFAULT_REGION
         self.locale = ALL[self.language]
 
     @property
@@ -47,6 +65,30 @@ class Game:
     def is_correct(self, value: str) -> bool:
         raise NotImplementedError()
 
+    async def get_movie(self) -> Movie:
+        raise NotImplementedError()
+
+    def speculate(self) -> None:
+        self.upcoming = http.detach(self.get_movie())
+
+    async def next_movie(self) -> Movie:
+        upcoming, self.upcoming = self.upcoming, None
+        if upcoming is not None:
+            try:
+                return await upcoming
+            except Exception:
+                pass
+        return await self.get_movie()
+
+    def discard(self) -> None:
+        upcoming, self.upcoming = self.upcoming, None
+        if upcoming is None:
+            return
+        if upcoming.done() and not upcoming.cancelled() and upcoming.exception() is None:
+            candidates(language=self.language, region=self.region).put(upcoming.result())
+        else:
+            upcoming.cancel()
+
     async def on_start(self) -> None:
         raise NotImplementedError()
 
@@ -63,8 +105,9 @@ class Game:
         await asyncio.sleep(0.5)
         self.selected = False
         if self.is_correct(value):
-            self.members[inter.author.mention] = self.members.get(inter.author.mention, 0) + 1
+            self.members[inter.author.id] = self.members.get(inter.author.id, 0) + 1
             await self.on_correct(inter)
+            self.speculate()
             self.embed.on_correct()
             self.view.on_correct()
             embeds = [disnake.Embed()] * len(self.images)
@@ -74,12 +117,19 @@ class Game:
                 embed.set_image(url=image)
             await inter.edit_original_message(embeds=embeds, view=self.view)
         else:
+            self.discard()
             await self.on_wrong(inter)
             self.embed.on_wrong()
             await inter.edit_original_message(embed=self.embed, view=None)
 
     async def start(self) -> None:
+        if self.server is None:
+            self.server = await Server.get_or_create(
+                id=self.inter.guild.id,
+                data={"language": DEFAULT_LANGUAGE, "region": DEFAULT_REGION, "frame_record": 0, "higher_record": 0}
+            )
         await self.on_start()
+        self.speculate()
         self.embed.on_start()
         self.view.on_start()
         embeds = [disnake.Embed()] * len(self.images)
@@ -87,7 +137,7 @@ class Game:
         for embed, image in zip(embeds, self.images):
             embed.url = self.images[0]
             embed.set_image(url=image)
-        await self.inter.send(embeds=embeds, view=self.view, ephemeral=self.ephemeral)
+        await Deadline.send(self.inter, embeds=embeds, view=self.view, ephemeral=self.ephemeral)
 
 
 class HigherLower(Game):
@@ -101,11 +151,9 @@ class HigherLower(Game):
         return self.server.higher_record or 0
 
     async def get_movie(self) -> Movie:
-        while True:
-            response = await tmdb.Movies(language=self.language, region=self.region).random()
-            movie = Movie(response)
-            if movie.image and getattr(movie, self.category) and movie not in self.movies:
-                return movie
+        return await candidates(language=self.language, region=self.region).take(
+            lambda movie: getattr(movie, self.category) and movie not in self.movies
+        )
 
     def is_correct(self, value: str) -> bool:
         if self.movies[0].title[:25] == value:
@@ -114,20 +162,20 @@ class HigherLower(Game):
             return getattr(self.movies[0], self.category) <= getattr(self.movies[1], self.category)
 
     async def on_start(self) -> None:
-        self.movies = [await self.get_movie(), await self.get_movie()]
+        self.movies = [await self.get_movie()]
+        self.movies.append(await self.get_movie())
         self.movie = self.movies[0]
         self.images = [movie.poster for movie in self.movies]
         self.options = [movie.title for movie in self.movies]
 
     async def on_correct(self, inter: disnake.MessageInteraction = None) -> None:
-        self.movies = [self.movies[1], await self.get_movie()]
+        self.movies = [self.movies[1], await self.next_movie()]
         self.movie = self.movies[0]
         self.images = [movie.poster for movie in self.movies]
         self.options = [movie.title for movie in self.movies]
 
     async def on_wrong(self, inter: disnake.MessageInteraction) -> None:
-        if self.score > self.record:
-            Server.update_by_id(inter.guild.id, data={"higher_record": self.score})
+        database.stats.add(inter.guild.id, record="higher_record", members=self.members)
 
 
 class FramedGame(Game):
@@ -141,13 +189,7 @@ class FramedGame(Game):
         return self.server.frame_record or 0
 
     async def get_movie(self) -> Movie:
-        while True:
-            response = await tmdb.Movies(language=self.language, region=self.region).random(
-                append="images,similar"
-            )
-            movie = Movie(response)
-            if movie.backdrops:
-                return movie
+        return await candidates(language=self.language, region=self.region).take(lambda movie: movie != self.movie)
 
     def get_movies(self, *, movie: Movie) -> list[Movie]:
         movies = [Movie(choice) for choice in random.sample(movie.similar, k=4)] + [movie]
@@ -164,14 +206,13 @@ class FramedGame(Game):
         self.options = [movie.title_and_year for movie in self.movies]
 
     async def on_correct(self, inter: disnake.MessageInteraction = None) -> None:
-        self.movie = await self.get_movie()
+        self.movie = await self.next_movie()
         self.movies = self.get_movies(movie=self.movie)
         self.images = [random.choice(self.movie.backdrops)]
         self.options = [movie.title_and_year for movie in self.movies]
 
     async def on_wrong(self, inter: disnake.MessageInteraction) -> None:
-        if self.score > self.record:
-            Server.update_by_id(inter.guild.id, data={"frame_record": self.score})
+        database.stats.add(inter.guild.id, record="frame_record", members=self.members)
 
 
 class GameDropdown(disnake.ui.Select):
@@ -269,7 +310,7 @@ class GameEmbed(disnake.Embed):
         self.title = self.game.locale["COMMAND_GAME_END"]
         self.description = "\n".join(
             [
-                f'{emoji} {member_score[0]} (**{member_score[1]}** {self.game.locale["COMMAND_GAME_POINTS"]})'
+                f'{emoji} <@{member_score[0]}> (**{member_score[1]}** {self.game.locale["COMMAND_GAME_POINTS"]})'
                 for member_score, emoji in zip(sorted(self.game.members.items(), key=lambda x: x[1], reverse=True)[:5], "🏆🥈🥉🏅🏅")
             ]
         )
@@ -282,9 +323,13 @@ class Games(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
 
+    @commands.Cog.listener()
+    async def on_ready(self) -> None:
+        candidates(language=DEFAULT_LANGUAGE, region=DEFAULT_REGION).refill()
+
     @commands.slash_command(name="game", description=DEFAULT["COMMAND_GAME_DESC"])
     async def slash_game(self, inter: disnake.ApplicationCommandInteraction) -> None:
-        await inter.response.defer()
+        await Deadline.acknowledge(inter)
 
     @slash_game.sub_command(name="framed", description=DEFAULT["COMMAND_GAME_FRAME_DESC"])
     async def slash_framed(self, inter: disnake.ApplicationCommandInteraction, hide: Choice.boolean = Option.hide) -> None:
@@ -4,12 +4,13 @@ from disnake.ext import commands
 
 from pypoca.config import COLOR, URLS
 from pypoca.database import Server
-from pypoca.ext import ALL, DEFAULT, Choice, Option
+from pypoca.ext import ALL, DEFAULT, DEFAULT_LANGUAGE, Choice, Deadline, Option
 
 
 class General(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.help_embeds = {}
 
     @commands.slash_command(name="ping", description=DEFAULT["COMMAND_PING_DESC"])
     async def slash_ping(self, inter: disnake.ApplicationCommandInteraction, hide: Choice.boolean = Option.hide):
@@ -20,13 +21,12 @@ class General(commands.Cog):
         description = locale["COMMAND_PING_REPLY"] + f": {latency}ms"
 
         embed = disnake.Embed(description=description, color=COLOR)
-        await inter.send(embed=embed, ephemeral=hide)
-
-    @commands.slash_command(name="help", description=DEFAULT["COMMAND_HELP_DESC"])
-    async def slash_help(self, inter: disnake.ApplicationCommandInteraction, hide: Choice.boolean = Option.hide):
-        server = Server.get_by_id(inter.guild.id)
-        locale = ALL[server.language] if server else DEFAULT
+        await Deadline.send(inter, embed=embed, ephemeral=hide)
 
+    def _help_embed(self, language: str) -> disnake.Embed:
+        if language in self.help_embeds:
+            return self.help_embeds[language]
+        locale = ALL[language]
         BLANK = "<:blank:914183315056111627>"
         description = f"""
             **/movie**
@@ -54,6 +54,16 @@ class General(commands.Cog):
             **/setting**
             {BLANK} **language** {locale["COMMAND_LANGUAGE_DESC"]}
         """
+        embed = disnake.Embed(description=description, color=COLOR)
+        self.help_embeds[language] = embed
+        return embed
+
+    @commands.slash_command(name="help", description=DEFAULT["COMMAND_HELP_DESC"])
+    async def slash_help(self, inter: disnake.ApplicationCommandInteraction, hide: Choice.boolean = Option.hide):
+        server = Server.get_by_id(inter.guild.id)
+        language = server.language if server else DEFAULT_LANGUAGE
+        locale = ALL[language]
+
         buttons = [
             {"style": 5, "label": locale["COMMAND_HELP_BUTTON_INVITE"], "url": URLS["invite"]},
             {"style": 5, "label": locale["COMMAND_HELP_BUTTON_VOTE"], "url": URLS["vote"]},
@@ -61,10 +71,10 @@ class General(commands.Cog):
             {"style": 5, "label": locale["COMMAND_HELP_BUTTON_SITE"], "url": URLS["site"]},
         ]
 
-        embed = disnake.Embed(description=description, color=COLOR)
+        embed = self._help_embed(language)
         view = disnake.ui.View()
         [view.add_item(disnake.ui.Button(**button)) for button in buttons]
-        await inter.send(embed=embed, view=view, ephemeral=hide)
+        await Deadline.send(inter, embed=embed, view=view, ephemeral=hide)
 
 
 def setup(bot: commands.Bot) -> None:
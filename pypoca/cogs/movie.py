@@ -4,13 +4,20 @@ import random
 import disnake
 from disnake.ext import commands
 
-from pypoca.config import COLOR
+from pypoca.config import COLOR, EMBED_CACHE
 from pypoca.database import Server
 from pypoca.exceptions import NoResults
-from pypoca.services import omdb, tmdb, trakt, translator, whatismymovie
-from pypoca.ext import ALL, DEFAULT, DEFAULT_LANGUAGE, DEFAULT_REGION, Choice, Movie, Option
+from pypoca.imports import lazy_import
+from pypoca.services import enrichment, tmdb
+from pypoca.services.catalog import catalog
+from pypoca.services.cache import TTLCache
+from pypoca.services.titles import titles
+from pypoca.ext import ALL, DEFAULT, DEFAULT_LANGUAGE, DEFAULT_REGION, Choice, Deadline, Movie, Option
 from pypoca.log import log
 
+translator = lazy_import("pypoca.services.translator")
+whatismymovie = lazy_import("pypoca.services.whatismymovie")
+
 
 class MovieButtons(disnake.ui.View):
     def __init__(self, inter: disnake.MessageInteraction, *, movie: Movie) -> None:
@@ -57,14 +64,10 @@ class MovieDropdown(disnake.ui.Select):
         language = server.language if server else DEFAULT_LANGUAGE
         region = server.region if server else DEFAULT_REGION
         movie_id = int(self.values[0])
-        result = await tmdb.Movie(id=movie_id, language=language, region=region).details(
-            append="credits,external_ids,recommendations,similar,videos,watch/providers"
-        )
-        result["external_ids"]["trakt_id"] = await trakt.Movie().trakt_id_by_tmdb_id(movie_id)
-        result["imdb"] = await omdb.Movie().ratings_by_imdb_id(result["external_ids"]["imdb_id"])
-        movie = Movie(result)
+        result = await enrichment.details("movie", movie_id, language=language, region=region)
+        movie = Movie(result, region=region)
         await inter.response.send_message(
-            embed=MovieEmbed(inter, movie=movie), view=MovieButtons(inter, movie=movie)
+            embed=MovieEmbed.render(movie=movie, language=language, region=region), view=MovieButtons(inter, movie=movie)
         )
 
 
@@ -75,10 +78,9 @@ class MovieSelect(disnake.ui.View):
 
 
 class MovieEmbed(disnake.Embed):
-    def __init__(self, inter: disnake.MessageInteraction, *, movie: Movie) -> None:
-        server = Server.get_by_id(inter.guild.id)
-        language = server.language if server else DEFAULT_LANGUAGE
-        region = server.region if server else DEFAULT_REGION
+    cache = TTLCache(maxsize=EMBED_CACHE["maxsize"])
+
+    def __init__(self, *, movie: Movie, language: str, region: str) -> None:
         locale = ALL[language]
         super().__init__(title=movie.title_and_year, description=f"_{movie.tagline}_" if movie.tagline else "", color=COLOR)
         if movie.homepage:
@@ -108,6 +110,17 @@ class MovieEmbed(disnake.Embed):
         self.add_field(
             name=locale["COMMAND_TV_FIELD_WATCH"], value=", ".join(movie.watch_on(region)) or "-", inline=True
         )
+        if movie.stale:
+            self.set_footer(text=locale["STALE_DATA"])
+
+    @classmethod
+    def render(cls, *, movie: Movie, language: str, region: str) -> "MovieEmbed":
+        key = (movie.id, movie.version, language, region)
+        embed = cls.cache.get(key)
+        if embed is None:
+            embed = cls(movie=movie, language=language, region=region)
+            cls.cache.set(key, embed, ttl=EMBED_CACHE["ttl"])
+        return embed
 
 
 class Movies(commands.Cog):
@@ -120,7 +133,7 @@ class Movies(commands.Cog):
         locale = ALL[language]
         if "NoResults" in error.args[0]:
             embed = disnake.Embed(title=locale["ERROR_NO_RESULTS_NAME"], description=locale["ERROR_NO_RESULTS_DESC"], color=disnake.Color.red())
-            await inter.send(embed=embed, ephemeral=True)
+            await Deadline.send(inter, embed=embed, ephemeral=True)
         else:
             log.error(f"{inter}. {error}", extra={"locals": locals(), "ctx": vars(inter)}, exc_info=error)
 
@@ -132,17 +145,13 @@ class Movies(commands.Cog):
             language = server.language if server else DEFAULT_LANGUAGE
             region = server.region if server else DEFAULT_REGION
             movie_id = Movie(results[0]).id
-            result = await tmdb.Movie(id=movie_id, language=language, region=region).details(
-                append="credits,external_ids,recommendations,similar,videos,watch/providers"
-            )
-            result["external_ids"]["trakt_id"] = await trakt.Movie().trakt_id_by_tmdb_id(movie_id)
-            result["imdb"] = await omdb.Movie().ratings_by_imdb_id(result["external_ids"]["imdb_id"])
-            movie = Movie(result)
-            await inter.send(
-                embed=MovieEmbed(inter, movie=movie), view=MovieButtons(inter, movie=movie)
+            result = await enrichment.details("movie", movie_id, language=language, region=region)
+            movie = Movie(result, region=region)
+            await Deadline.send(
+                inter, embed=MovieEmbed.render(movie=movie, language=language, region=region), view=MovieButtons(inter, movie=movie)
             )
         else:
-            await inter.send(view=MovieSelect(inter, movies=[Movie(result) for result in results]))
+            await Deadline.send(inter, view=MovieSelect(inter, movies=[Movie(result) for result in results]))
 
     @commands.group(name="movie", description=DEFAULT["COMMAND_MOVIE_DESC"])
     async def movie(self, ctx: commands.Context) -> None:
@@ -158,7 +167,7 @@ class Movies(commands.Cog):
 
     @movie.command(name="find", description=DEFAULT["COMMAND_MOVIE_FIND_DESC"])
     async def find(self, ctx: commands.Context, *, query: str = Option.query) -> None:
-        overview = translator.Translator().translate(query)
+        overview = await translator.Translator().translate(query)
         name = await whatismymovie.Movie().name_by_overview(overview)
         server = Server.get_by_id(ctx.guild.id)
         language = server.language if server else DEFAULT_LANGUAGE
@@ -232,6 +241,9 @@ class Movies(commands.Cog):
         server = Server.get_by_id(inter.guild.id)
         language = server.language if server else DEFAULT_LANGUAGE
         region = server.region if server else DEFAULT_REGION
+        service = catalog.available("movie", region=region, providers=service)
+        if service == "":
+            raise NoResults()
         response = await tmdb.Movies(language=language, region=region).discover(
             page=page,
             include_adult=nsfw,
@@ -252,8 +264,8 @@ class Movies(commands.Cog):
 
     @slash_movie.sub_command(name="find", description=DEFAULT["COMMAND_MOVIE_FIND_DESC"])
     async def slash_find(self, inter: disnake.ApplicationCommandInteraction, query: str = Option.query) -> None:
-        await inter.response.defer()
-        overview = translator.Translator().translate(query)
+        await Deadline.acknowledge(inter)
+        overview = await translator.Translator().translate(query)
         name = await whatismymovie.Movie().name_by_overview(overview)
         server = Server.get_by_id(inter.guild.id)
         language = server.language if server else DEFAULT_LANGUAGE
@@ -284,6 +296,10 @@ class Movies(commands.Cog):
         response = await tmdb.Movies(language=language, region=region).search(query, page=page, include_adult=nsfw, year=year)
         await self._reply(inter, results=response["results"])
 
+    @slash_search.autocomplete("query")
+    async def slash_search_query(self, inter: disnake.ApplicationCommandInteraction, query: str) -> dict[str, str]:
+        return titles.complete("movie", query)
+
     @slash_movie.sub_command(name="top", description=DEFAULT["COMMAND_MOVIE_TOP_DESC"])
     async def slash_top(self, inter: disnake.ApplicationCommandInteraction, page: int = Option.page) -> None:
         server = Server.get_by_id(inter.guild.id)
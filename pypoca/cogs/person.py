@@ -4,11 +4,13 @@ import random
 import disnake
 from disnake.ext import commands
 
-from pypoca.config import COLOR
+from pypoca.config import COLOR, EMBED_CACHE
 from pypoca.database import Server
 from pypoca.exceptions import NoResults
-from pypoca.services import tmdb, trakt
-from pypoca.ext import ALL, DEFAULT, DEFAULT_LANGUAGE, DEFAULT_REGION, Choice, Option, Person
+from pypoca.services import tmdb
+from pypoca.services.cache import TTLCache
+from pypoca.services.titles import titles
+from pypoca.ext import ALL, DEFAULT, DEFAULT_LANGUAGE, DEFAULT_REGION, Choice, Deadline, Option, Person
 from pypoca.log import log
 
 
@@ -65,7 +67,7 @@ class PersonDropdown(disnake.ui.Select):
         )
         person = Person(result)
         await inter.response.send_message(
-            embed=PersonEmbed(inter, person=person), view=PersonButtons(inter, person=person)
+            embed=PersonEmbed.render(person=person, language=language), view=PersonButtons(inter, person=person)
         )
 
 
@@ -76,9 +78,9 @@ class PersonSelect(disnake.ui.View):
 
 
 class PersonEmbed(disnake.Embed):
-    def __init__(self, inter: disnake.MessageInteraction, *, person: Person) -> None:
-        server = Server.get_by_id(inter.guild.id)
-        language = server.language if server else DEFAULT_LANGUAGE
+    cache = TTLCache(maxsize=EMBED_CACHE["maxsize"])
+
+    def __init__(self, *, person: Person, language: str) -> None:
         locale = ALL[language]
         super().__init__(title=person.name, description=person.biography, color=COLOR)
         if person.homepage:
@@ -97,6 +99,17 @@ class PersonEmbed(disnake.Embed):
         self.add_field(
             name=locale["COMMAND_PERSON_FIELD_KNOW_FOR"], value=", ".join(person.jobs[:6]) or "-", inline=False
         )
+        if person.stale:
+            self.set_footer(text=locale["STALE_DATA"])
+
+    @classmethod
+    def render(cls, *, person: Person, language: str) -> "PersonEmbed":
+        key = (person.id, person.version, language)
+        embed = cls.cache.get(key)
+        if embed is None:
+            embed = cls(person=person, language=language)
+            cls.cache.set(key, embed, ttl=EMBED_CACHE["ttl"])
+        return embed
 
 
 class People(commands.Cog):
@@ -109,7 +122,7 @@ class People(commands.Cog):
         locale = ALL[language]
         if "NoResults" in error.args[0]:
             embed = disnake.Embed(title=locale["ERROR_NO_RESULTS_NAME"], description=locale["ERROR_NO_RESULTS_DESC"], color=disnake.Color.red())
-            await inter.send(embed=embed, ephemeral=True)
+            await Deadline.send(inter, embed=embed, ephemeral=True)
         else:
             log.error(f"{inter}. {error}", extra={"locals": locals(), "ctx": vars(inter)}, exc_info=error)
 
@@ -125,11 +138,11 @@ class People(commands.Cog):
                 append="combined_credits,external_ids"
             )
             person = Person(result)
-            await inter.send(
-                embed=PersonEmbed(inter, person=person), view=PersonButtons(inter, person=person)
+            await Deadline.send(
+                inter, embed=PersonEmbed.render(person=person, language=language), view=PersonButtons(inter, person=person)
             )
         else:
-            await inter.send(view=PersonSelect(inter, people=[Person(result) for result in results]))
+            await Deadline.send(inter, view=PersonSelect(inter, people=[Person(result) for result in results]))
 
     @commands.group(name="people", description=DEFAULT["COMMAND_PERSON_DESC"])
     async def person(self, ctx: commands.Context) -> None:
@@ -185,6 +198,10 @@ class People(commands.Cog):
         response = await tmdb.People(language=language, region=region).search(query, page=page, include_adult=nsfw)
         await self._reply(inter, results=response["results"])
 
+    @slash_search.autocomplete("query")
+    async def slash_search_query(self, inter: disnake.ApplicationCommandInteraction, query: str) -> dict[str, str]:
+        return titles.complete("person", query)
+
     @slash_person.sub_command(name="trending", description=DEFAULT["COMMAND_PERSON_TRENDING_DESC"])
     async def slash_trending(
         self, inter: disnake.ApplicationCommandInteraction, interval: Choice.interval = Option.interval, page: int = Option.page
@@ -4,7 +4,7 @@ from disnake.ext import commands
 
 from pypoca.config import COLOR
 from pypoca.database import Server
-from pypoca.ext import ALL, DEFAULT, Choice, Option
+from pypoca.ext import ALL, DEFAULT, Choice, Deadline, Option
 from pypoca.log import log
 
 
@@ -18,7 +18,7 @@ class Setting(commands.Cog):
         locale = ALL[language]
         if isinstance(error, commands.MissingPermissions):
             embed = disnake.Embed(title=locale["ERROR_NO_PERMISSION_NAME"], description=locale["ERROR_NO_PERMISSION_DESC"], color=disnake.Color.red())
-            await inter.send(embed=embed, ephemeral=True)
+            await Deadline.send(inter, embed=embed, ephemeral=True)
         else:
             log.error(f"{inter}. {error}", extra={"locals": locals(), "ctx": vars(inter)}, exc_info=error)
 
@@ -29,12 +29,12 @@ class Setting(commands.Cog):
     @commands.has_permissions(administrator=True)
     @slash_setting.sub_command(name="language", description=DEFAULT["COMMAND_LANGUAGE_DESC"])
     async def slash_language(self, inter: disnake.ApplicationCommandInteraction, language: Choice.language = Option.language) -> None:
-        Server.update_or_create(id=inter.guild.id, data={"language": language, "region": language[3:]})
+        await Server.update_or_create(id=inter.guild.id, data={"language": language, "region": language[3:]})
         server = Server.get_by_id(inter.guild.id)
         locale = ALL[server.language] if server else DEFAULT
         description = locale["COMMAND_LANGUAGE_REPLY"]
         embed = disnake.Embed(description=description, color=COLOR)
-        await inter.send(embed=embed)
+        await Deadline.send(inter, embed=embed)
 
 
 def setup(bot: commands.Bot) -> None:
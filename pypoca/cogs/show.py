@@ -4,11 +4,14 @@ import random
 import disnake
 from disnake.ext import commands
 
-from pypoca.config import COLOR
+from pypoca.config import COLOR, EMBED_CACHE
 from pypoca.database import Server
 from pypoca.exceptions import NoResults
-from pypoca.services import omdb, tmdb, trakt
-from pypoca.ext import ALL, DEFAULT, DEFAULT_LANGUAGE, DEFAULT_REGION, Choice, Option, Show
+from pypoca.services import enrichment, tmdb
+from pypoca.services.catalog import catalog
+from pypoca.services.cache import TTLCache
+from pypoca.services.titles import titles
+from pypoca.ext import ALL, DEFAULT, DEFAULT_LANGUAGE, DEFAULT_REGION, Choice, Deadline, Option, Show
 from pypoca.log import log
 
 
@@ -57,14 +60,10 @@ class ShowDropdown(disnake.ui.Select):
         language = server.language if server else DEFAULT_LANGUAGE
         region = server.region if server else DEFAULT_REGION
         show_id = int(self.values[0])
-        result = await tmdb.Show(id=show_id, language=language, region=region).details(
-            append="credits,external_ids,recommendations,similar,videos,watch/providers"
-        )
-        result["external_ids"]["trakt_id"] = await trakt.Show().trakt_id_by_tmdb_id(show_id)
-        result["imdb"] = await omdb.Show().ratings_by_imdb_id(result["external_ids"]["imdb_id"])
-        show = Show(result)
+        result = await enrichment.details("tv", show_id, language=language, region=region)
+        show = Show(result, region=region)
         await inter.response.send_message(
-            embed=ShowEmbed(inter, show=show), view=ShowButtons(inter, show=show)
+            embed=ShowEmbed.render(show=show, language=language, region=region), view=ShowButtons(inter, show=show)
         )
 
 
@@ -75,10 +74,9 @@ class ShowSelect(disnake.ui.View):
 
 
 class ShowEmbed(disnake.Embed):
-    def __init__(self, inter: disnake.MessageInteraction, *, show: Show) -> None:
-        server = Server.get_by_id(inter.guild.id)
-        language = server.language if server else DEFAULT_LANGUAGE
-        region = server.region if server else DEFAULT_REGION
+    cache = TTLCache(maxsize=EMBED_CACHE["maxsize"])
+
+    def __init__(self, *, show: Show, language: str, region: str) -> None:
         locale = ALL[language]
         super().__init__(title=show.title_and_year, description=f"_{show.tagline}_" if show.tagline else "", color=COLOR)
         if show.homepage:
@@ -117,6 +115,17 @@ class ShowEmbed(disnake.Embed):
         self.add_field(
             name=locale["COMMAND_TV_FIELD_WATCH"], value=", ".join(show.watch_on(region)) or "-", inline=True
         )
+        if show.stale:
+            self.set_footer(text=locale["STALE_DATA"])
+
+    @classmethod
+    def render(cls, *, show: Show, language: str, region: str) -> "ShowEmbed":
+        key = (show.id, show.version, language, region)
+        embed = cls.cache.get(key)
+        if embed is None:
+            embed = cls(show=show, language=language, region=region)
+            cls.cache.set(key, embed, ttl=EMBED_CACHE["ttl"])
+        return embed
 
 
 class Shows(commands.Cog):
@@ -129,7 +138,7 @@ class Shows(commands.Cog):
         locale = ALL[language]
         if "NoResults" in error.args[0]:
             embed = disnake.Embed(title=locale["ERROR_NO_RESULTS_NAME"], description=locale["ERROR_NO_RESULTS_DESC"], color=disnake.Color.red())
-            await inter.send(embed=embed, ephemeral=True)
+            await Deadline.send(inter, embed=embed, ephemeral=True)
         else:
             log.error(f"{inter}. {error}", extra={"locals": locals(), "ctx": vars(inter)}, exc_info=error)
 
@@ -141,17 +150,13 @@ class Shows(commands.Cog):
             language = server.language if server else DEFAULT_LANGUAGE
             region = server.region if server else DEFAULT_REGION
             show_id = Show(results[0]).id
-            result = await tmdb.Show(id=show_id, language=language, region=region).details(
-                append="credits,external_ids,recommendations,similar,videos,watch/providers"
-            )
-            result["external_ids"]["trakt_id"] = await trakt.Show().trakt_id_by_tmdb_id(show_id)
-            result["imdb"] = await omdb.Show().ratings_by_imdb_id(result["external_ids"]["imdb_id"])
-            show = Show(result)
-            await inter.send(
-                embed=ShowEmbed(inter, show=show), view=ShowButtons(inter, show=show)
+            result = await enrichment.details("tv", show_id, language=language, region=region)
+            show = Show(result, region=region)
+            await Deadline.send(
+                inter, embed=ShowEmbed.render(show=show, language=language, region=region), view=ShowButtons(inter, show=show)
             )
         else:
-            await inter.send(view=ShowSelect(inter, shows=[Show(result) for result in results]))
+            await Deadline.send(inter, view=ShowSelect(inter, shows=[Show(result) for result in results]))
 
     @commands.group(name="tv", description=DEFAULT["COMMAND_TV_DESC"])
     async def tv(self, ctx: commands.Context) -> None:
@@ -228,6 +233,9 @@ class Shows(commands.Cog):
         server = Server.get_by_id(inter.guild.id)
         language = server.language if server else DEFAULT_LANGUAGE
         region = server.region if server else DEFAULT_REGION
+        service = catalog.available("tv", region=region, providers=service)
+        if service == "":
+            raise NoResults()
         response = await tmdb.Shows(language=language, region=region).discover(
             page=page,
             sort_by=sort_by,
@@ -266,6 +274,10 @@ class Shows(commands.Cog):
         response = await tmdb.Shows(language=language, region=region).search(query, page=page, include_adult=nsfw, first_air_date_year=year)
         await self._reply(inter, results=response["results"])
 
+    @slash_search.autocomplete("query")
+    async def slash_search_query(self, inter: disnake.ApplicationCommandInteraction, query: str) -> dict[str, str]:
+        return titles.complete("tv", query)
+
     @slash_tv.sub_command(name="top", description=DEFAULT["COMMAND_TV_TOP_DESC"])
     async def slash_top(self, inter: disnake.ApplicationCommandInteraction, page: int = Option.page) -> None:
         server = Server.get_by_id(inter.guild.id)
@@ -30,3 +30,150 @@ DB_CREDENTIALS = {
     "database": os.environ.get("DB_NAME"),
     "filename": os.environ.get("DB_FILENAME"),
 }
+DB_WORKERS = int(os.environ.get("DB_WORKERS") or 4)
+DB_FLUSH_INTERVAL = int(os.environ.get("DB_FLUSH_INTERVAL") or 30)
+
+SHARDING = {
+    "sharded": (os.environ.get("SHARDED") or "false").lower() in ("1", "true", "yes"),
+    "shard_count": int(os.environ.get("SHARD_COUNT") or 0),
+    "shard_ids": os.environ.get("SHARD_IDS", ""),
+}
+
+CLUSTER = {
+    "id": int(os.environ.get("CLUSTER_ID") or 0),
+    "count": int(os.environ.get("CLUSTER_COUNT") or 1),
+    "health_fd": int(os.environ.get("CLUSTER_HEALTH_FD") or -1),
+    "health_port": int(os.environ.get("CLUSTER_HEALTH_PORT") or 0),
+    "heartbeat_interval": float(os.environ.get("CLUSTER_HEARTBEAT_INTERVAL") or 10),
+    "heartbeat_timeout": float(os.environ.get("CLUSTER_HEARTBEAT_TIMEOUT") or 120),
+    "restart_delay": float(os.environ.get("CLUSTER_RESTART_DELAY") or 5),
+}
+
+EMBED_CACHE = {
+    "maxsize": int(os.environ.get("EMBED_CACHE_MAXSIZE") or 1024),
+    "ttl": int(os.environ.get("EMBED_CACHE_TTL") or 3600),
+}
+
+TITLE_INDEX = {
+    "maxsize": int(os.environ.get("TITLE_INDEX_MAXSIZE") or 20000),
+    "max_scan": int(os.environ.get("TITLE_INDEX_MAX_SCAN") or 500),
+    "max_distance": float(os.environ.get("TITLE_INDEX_MAX_DISTANCE") or 0.34),
+    "search_budget": float(os.environ.get("TITLE_INDEX_SEARCH_BUDGET") or 2.5),
+    "refresh_interval": int(os.environ.get("TITLE_INDEX_REFRESH_INTERVAL") or 3600),
+}
+
+CATALOG_REFRESH_INTERVAL = int(os.environ.get("CATALOG_REFRESH_INTERVAL") or 86400)
+
+TRANSLATION_CACHE = {
+    "maxsize": int(os.environ.get("TRANSLATION_CACHE_MAXSIZE") or 1024),
+    "ttl": int(os.environ.get("TRANSLATION_CACHE_TTL") or 604800),
+}
+
+GAME_POOL = {
+    "low": int(os.environ.get("GAME_POOL_LOW") or 5),
+    "high": int(os.environ.get("GAME_POOL_HIGH") or 20),
+}
+
+DEFER_MARGIN = float(os.environ.get("INTERACTION_DEFER_MARGIN") or 0.5)
+
+HTTP_SETTINGS = {
+    "limit": int(os.environ.get("HTTP_LIMIT") or 100),
+    "limit_per_host": int(os.environ.get("HTTP_LIMIT_PER_HOST") or 20),
+    "keepalive_timeout": float(os.environ.get("HTTP_KEEPALIVE_TIMEOUT") or 30),
+    "ttl_dns_cache": int(os.environ.get("HTTP_DNS_CACHE_TTL") or 300),
+    "connect_timeout": float(os.environ.get("HTTP_CONNECT_TIMEOUT") or 3),
+    "read_timeout": float(os.environ.get("HTTP_READ_TIMEOUT") or 10),
+    "total_timeout": float(os.environ.get("HTTP_TOTAL_TIMEOUT") or 15),
+}
+
+TMDB_CACHE = {
+    "maxsize": int(os.environ.get("TMDB_CACHE_MAXSIZE") or 2048),
+    "lists_ttl": int(os.environ.get("TMDB_CACHE_LISTS_TTL") or 600),
+    "details_ttl": int(os.environ.get("TMDB_CACHE_DETAILS_TTL") or 21600),
+    "catalog_ttl": int(os.environ.get("TMDB_CACHE_CATALOG_TTL") or 86400),
+    "max_stale": int(os.environ.get("TMDB_CACHE_MAX_STALE") or 86400),
+    "stale_while_revalidate": (os.environ.get("TMDB_CACHE_STALE_WHILE_REVALIDATE") or "true").lower() in ("1", "true", "yes"),
+}
+
+OMDB_CACHE = {
+    "maxsize": int(os.environ.get("OMDB_CACHE_MAXSIZE") or 2048),
+    "ttl": int(os.environ.get("OMDB_CACHE_TTL") or 86400),
+    "max_stale": int(os.environ.get("OMDB_CACHE_MAX_STALE") or 604800),
+    "stale_while_revalidate": (os.environ.get("OMDB_CACHE_STALE_WHILE_REVALIDATE") or "true").lower() in ("1", "true", "yes"),
+}
+
+WHATISMYMOVIE_CACHE = {
+    "maxsize": int(os.environ.get("WHATISMYMOVIE_CACHE_MAXSIZE") or 1024),
+    "ttl": int(os.environ.get("WHATISMYMOVIE_CACHE_TTL") or 604800),
+    "negative_ttl": int(os.environ.get("WHATISMYMOVIE_CACHE_NEGATIVE_TTL") or 3600),
+    "max_bytes": int(os.environ.get("WHATISMYMOVIE_MAX_BYTES") or 1048576),
+}
+
+ENRICHMENT_TIMEOUT = {
+    "trakt": float(os.environ.get("ENRICHMENT_TRAKT_TIMEOUT") or 1.5),
+    "omdb": float(os.environ.get("ENRICHMENT_OMDB_TIMEOUT") or 1.5),
+    "database": float(os.environ.get("ENRICHMENT_DATABASE_TIMEOUT") or 0.5),
+}
+
+EXTERNAL_ID_CACHE = {
+    "maxsize": int(os.environ.get("EXTERNAL_ID_CACHE_MAXSIZE") or 4096),
+    "ttl": int(os.environ.get("EXTERNAL_ID_CACHE_TTL") or 86400),
+}
+
+RATE_LIMITS = {
+    "tmdb": {
+        "rate": float(os.environ.get("TMDB_RATE_LIMIT") or 40),
+        "burst": int(os.environ.get("TMDB_RATE_BURST") or 40),
+    },
+    "omdb": {
+        "rate": float(os.environ.get("OMDB_RATE_LIMIT") or 10),
+        "burst": int(os.environ.get("OMDB_RATE_BURST") or 10),
+    },
+    "trakt": {
+        "rate": float(os.environ.get("TRAKT_RATE_LIMIT") or 3),
+        "burst": int(os.environ.get("TRAKT_RATE_BURST") or 10),
+    },
+    "whatismymovie": {
+        "rate": float(os.environ.get("WHATISMYMOVIE_RATE_LIMIT") or 1),
+        "burst": int(os.environ.get("WHATISMYMOVIE_RATE_BURST") or 2),
+    },
+}
+RATE_LIMIT_RETRIES = int(os.environ.get("RATE_LIMIT_RETRIES") or 3)
+
+TMDB_DISK_CACHE = {
+    "path": os.environ.get("TMDB_DISK_CACHE_PATH") or "tmdb_cache.sqlite",
+    "maxsize": int(os.environ.get("TMDB_DISK_CACHE_MAXSIZE") or 50000),
+    "ttl": int(os.environ.get("TMDB_DISK_CACHE_TTL") or 604800),
+    "compact_interval": int(os.environ.get("TMDB_DISK_CACHE_COMPACT_INTERVAL") or 3600),
+}
+
+UPSTREAMS = {
+    "tmdb": {
+        "connect_timeout": float(os.environ.get("TMDB_CONNECT_TIMEOUT") or 2),
+        "read_timeout": float(os.environ.get("TMDB_READ_TIMEOUT") or 5),
+        "concurrency": int(os.environ.get("TMDB_CONCURRENCY") or 30),
+        "failures": int(os.environ.get("TMDB_BREAKER_FAILURES") or 5),
+        "reset_timeout": float(os.environ.get("TMDB_BREAKER_RESET_TIMEOUT") or 30),
+    },
+    "omdb": {
+        "connect_timeout": float(os.environ.get("OMDB_CONNECT_TIMEOUT") or 1),
+        "read_timeout": float(os.environ.get("OMDB_READ_TIMEOUT") or 2),
+        "concurrency": int(os.environ.get("OMDB_CONCURRENCY") or 10),
+        "failures": int(os.environ.get("OMDB_BREAKER_FAILURES") or 3),
+        "reset_timeout": float(os.environ.get("OMDB_BREAKER_RESET_TIMEOUT") or 60),
+    },
+    "trakt": {
+        "connect_timeout": float(os.environ.get("TRAKT_CONNECT_TIMEOUT") or 1),
+        "read_timeout": float(os.environ.get("TRAKT_READ_TIMEOUT") or 2),
+        "concurrency": int(os.environ.get("TRAKT_CONCURRENCY") or 10),
+        "failures": int(os.environ.get("TRAKT_BREAKER_FAILURES") or 3),
+        "reset_timeout": float(os.environ.get("TRAKT_BREAKER_RESET_TIMEOUT") or 60),
+    },
+    "whatismymovie": {
+        "connect_timeout": float(os.environ.get("WHATISMYMOVIE_CONNECT_TIMEOUT") or 2),
+        "read_timeout": float(os.environ.get("WHATISMYMOVIE_READ_TIMEOUT") or 5),
+        "concurrency": int(os.environ.get("WHATISMYMOVIE_CONCURRENCY") or 5),
+        "failures": int(os.environ.get("WHATISMYMOVIE_BREAKER_FAILURES") or 3),
+        "reset_timeout": float(os.environ.get("WHATISMYMOVIE_BREAKER_RESET_TIMEOUT") or 60),
+    },
+}
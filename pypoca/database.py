@@ -1,9 +1,83 @@
 # -*- coding: utf-8 -*-
+import asyncio
+import functools
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Callable, NamedTuple
 
-from pony.orm import Database, Optional, PrimaryKey, Required, db_session
+from pony.orm import (
+    CommitException,
+    Database,
+    Optional,
+    PrimaryKey,
+    Required,
+    TransactionIntegrityError,
+    db_session,
+    select,
+)
+
+from pypoca.config import DB_WORKERS
+from pypoca.log import log
 
 db = Database()
+executor = ThreadPoolExecutor(max_workers=DB_WORKERS, thread_name_prefix="database")
+
+
+def in_executor(function: Callable) -> Callable:
+    @functools.wraps(function)
+    async def wrapper(*args, **kwargs) -> object:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(function, *args, **kwargs))
+
+    return wrapper
+
+
+class Settings(NamedTuple):
+    id: int
+    language: str
+    region: str
+    frame_record: int
+    higher_record: int
+
+    @classmethod
+    def from_row(cls, id: int, language: str, region: str, frame_record: int, higher_record: int) -> "Settings":
+        return cls(id, sys.intern(language or ""), sys.intern(region or ""), frame_record, higher_record)
+
+
+class SettingsCache:
+    def __init__(self) -> None:
+        self.loaded = False
+        self.settings = {}
+
+    def __len__(self) -> int:
+        return len(self.settings)
+
+    def __contains__(self, id: int) -> bool:
+        return id in self.settings
+
+    def get(self, id: int) -> Settings:
+        return self.settings.get(id)
+
+    def set(self, server: "Server") -> Settings:
+        settings = Settings.from_row(server.id, server.language, server.region, server.frame_record, server.higher_record)
+        self.settings[settings.id] = settings
+        return settings
+
+    def update(self, id: int, **values) -> None:
+        if id in self.settings:
+            self.settings[id] = self.settings[id]._replace(**values)
+
+    def load(self, rows: list[tuple]) -> None:
+        self.settings = {row[0]: Settings.from_row(*row) for row in rows}
+        self.loaded = True
+
+    def clear(self) -> None:
+        self.settings.clear()
+        self.loaded = False
+
+
+settings = SettingsCache()
 
 
 class Server(db.Entity):
@@ -24,20 +98,183 @@ class Server(db.Entity):
 
     @classmethod
     @db_session
-    def get_by_id(cls, id: int) -> db.Entity:
-        return cls.get(id=id)
+    def preload(cls) -> None:
+        settings.load(select((s.id, s.language, s.region, s.frame_record, s.higher_record) for s in cls)[:])
 
     @classmethod
-    @db_session
+    def get_by_id(cls, id: int) -> Settings:
+        if id in settings or settings.loaded:
+            return settings.get(id)
+        with db_session:
+            server = cls.get(id=id)
+            return settings.set(server) if server else None
+
+    @classmethod
+    @in_executor
     def update_by_id(cls, id: int, *, data: dict) -> None:
-        cls[id].set(**data)
+        with db_session:
+            server = cls[id]
+            server.set(**data)
+        settings.set(server)
 
     @classmethod
-    @db_session
+    @in_executor
     def update_or_create(cls, *, id: int, data: dict) -> None:
-        cls.update_by_id(id, data=data) if cls.exists(id=id) else cls(id=id, **data)
+        try:
+            with db_session:
+                server = cls.get(id=id)
+                if server:
+                    server.set(**data)
+                else:
+                    server = cls(id=id, **data)
+        except (TransactionIntegrityError, CommitException):
+            with db_session:
+                server = cls[id]
+                server.set(**data)
+        settings.set(server)
 
     @classmethod
+    @in_executor
+    def get_or_create(cls, *, id: int, data: dict = {}) -> Settings:
+        server = cls.get_by_id(id)
+        if server is None:
+            try:
+                with db_session:
+                    server = cls(id=id, **data)
+            except (TransactionIntegrityError, CommitException):
+                with db_session:
+                    server = cls[id]
+            server = settings.set(server)
+        return server
+
+
+class ExternalId(db.Entity):
+    tmdb_id = Required(int, size=64)
+    media_type = Required(str)
+    PrimaryKey(tmdb_id, media_type)
+    trakt_id = Optional(int, size=64)
+    imdb_id = Optional(str)
+    imdb_rating = Optional(float)
+    imdb_votes = Optional(int)
+    created_on = Required(datetime, default=datetime.utcnow)
+    updated_on = Optional(datetime)
+
+    def before_insert(self) -> None:
+        self.created_on = datetime.utcnow()
+        self.updated_on = datetime.utcnow()
+
+    def before_update(self) -> None:
+        self.updated_on = datetime.utcnow()
+
+    @classmethod
+    @in_executor
     @db_session
-    def get_or_create(cls, *, id: int, data: dict = {}) -> db.Entity:
-        return cls.get_by_id(id) or cls(id=id, **data)
+    def get_by_tmdb_id(cls, tmdb_id: int, *, media_type: str) -> db.Entity:
+        return cls.get(tmdb_id=tmdb_id, media_type=media_type)
+
+    @classmethod
+    @in_executor
+    @db_session
+    def get_by_tmdb_ids(cls, tmdb_ids: list[int], *, media_type: str) -> dict:
+        return {
+            external_id.tmdb_id: external_id
+            for external_id in cls.select(lambda e: e.media_type == media_type and e.tmdb_id in tmdb_ids)
+        }
+
+    @classmethod
+    @in_executor
+    def update_or_create(cls, *, tmdb_id: int, media_type: str, data: dict) -> None:
+        try:
+            with db_session:
+                external_id = cls.get(tmdb_id=tmdb_id, media_type=media_type)
+                external_id.set(**data) if external_id else cls(tmdb_id=tmdb_id, media_type=media_type, **data)
+        except (TransactionIntegrityError, CommitException):
+            with db_session:
+                cls[tmdb_id, media_type].set(**data)
+
+
+class MemberStats(db.Entity):
+    server_id = Required(int, size=64)
+    member_id = Required(int, size=64)
+    PrimaryKey(server_id, member_id)
+    games = Required(int, default=0)
+    points = Required(int, default=0)
+    best_score = Required(int, default=0)
+    created_on = Required(datetime, default=datetime.utcnow)
+    updated_on = Optional(datetime)
+
+    def before_insert(self) -> None:
+        self.created_on = datetime.utcnow()
+        self.updated_on = datetime.utcnow()
+
+    def before_update(self) -> None:
+        self.updated_on = datetime.utcnow()
+
+
+class StatsBuffer:
+    def __init__(self) -> None:
+        self.records = {}
+        self.members = {}
+
+    def __len__(self) -> int:
+        return len(self.records) + len(self.members)
+
+    def add(self, server_id: int, *, record: str, members: dict[int, int]) -> None:
+        score = sum(members.values())
+        key = (server_id, record)
+        if score > self.records.get(key, 0):
+            self.records[key] = score
+        server = settings.get(server_id)
+        if server and score > (getattr(server, record) or 0):
+            settings.update(server_id, **{record: score})
+        for member_id, points in members.items():
+            games, total, best = self.members.get((server_id, member_id), (0, 0, 0))
+            self.members[(server_id, member_id)] = (games + 1, total + points, max(best, points))
+
+    def drain(self) -> tuple[dict, dict]:
+        records, members = self.records, self.members
+        self.records, self.members = {}, {}
+        return records, members
+
+    def merge(self, records: dict, members: dict) -> None:
+        for key, score in records.items():
+            self.records[key] = max(score, self.records.get(key, 0))
+        for key, (games, total, best) in members.items():
+            pending = self.members.get(key, (0, 0, 0))
+            self.members[key] = (games + pending[0], total + pending[1], max(best, pending[2]))
+
+    async def flush(self) -> None:
+        if not len(self):
+            return
+        records, members = self.drain()
+        try:
+            await self.write(records, members)
+        except Exception as error:
+            self.merge(records, members)
+            log.error(f"Failed to flush {len(records)} records and {len(members)} member stats. {error}", exc_info=error)
+
+    @staticmethod
+    @in_executor
+    @db_session
+    def write(records: dict, members: dict) -> None:
+        server_ids = list({server_id for server_id, _ in records})
+        servers = {server.id: server for server in Server.select(lambda s: s.id in server_ids)}
+        for (server_id, record), score in records.items():
+            server = servers.get(server_id)
+            if server and score > (getattr(server, record) or 0):
+                server.set(**{record: score})
+        server_ids = list({server_id for server_id, _ in members})
+        member_ids = list({member_id for _, member_id in members})
+        existing = {
+            (member.server_id, member.member_id): member
+            for member in MemberStats.select(lambda m: m.server_id in server_ids and m.member_id in member_ids)
+        }
+        for (server_id, member_id), (games, total, best) in members.items():
+            member = existing.get((server_id, member_id))
+            if member:
+                member.set(games=member.games + games, points=member.points + total, best_score=max(member.best_score, best))
+            else:
+                MemberStats(server_id=server_id, member_id=member_id, games=games, points=total, best_score=best)
+
+
+stats = StatsBuffer()
@@ -8,6 +8,14 @@ class RequestException(PypocaException):
     pass
 
 
+class CircuitOpenException(RequestException):
+    pass
+
+
+class DeadlineException(RequestException):
+    pass
+
+
 class OMDbException(RequestException):
     pass
 
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from pypoca.ext.choice import Choice
+from pypoca.ext.deadline import Deadline
 from pypoca.ext.entities.movie import Movie
 from pypoca.ext.entities.person import Person
 from pypoca.ext.entities.show import Show
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import time
+from collections import defaultdict
+
+import disnake
+
+from pypoca.config import DEFER_MARGIN
+from pypoca.services import http
+
+RESPONSE_TIMEOUT = 3
+FOLLOWUP_TIMEOUT = 15 * 60
+
+
+class Deadline:
+    usage = defaultdict(set)
+
+    def __init__(self, inter: disnake.ApplicationCommandInteraction) -> None:
+        self.inter = inter
+        self.command = inter.application_command.qualified_name
+        self.created_on = min(inter.created_at.timestamp(), time.time())
+        self.task = None
+        self.lock = asyncio.Lock()
+
+    @property
+    def response_remaining(self) -> float:
+        return self.created_on + RESPONSE_TIMEOUT - time.time()
+
+    @property
+    def deferrable(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+    @property
+    def remaining(self) -> float:
+        if self.inter.response.is_done() or self.deferrable:
+            return self.created_on + FOLLOWUP_TIMEOUT - time.time()
+        return self.response_remaining
+
+    def observe(self, upstream: str) -> None:
+        self.usage[self.command].add(upstream)
+
+    @staticmethod
+    def current(inter: disnake.Interaction) -> "Deadline":
+        deadline = http.deadline.get()
+        return deadline if deadline is not None and deadline.inter is inter else None
+
+    @classmethod
+    async def send(cls, inter: disnake.Interaction, *args, **kwargs) -> None:
+        deadline = cls.current(inter)
+        if deadline is None:
+            return await inter.send(*args, **kwargs)
+        async with deadline.lock:
+            return await inter.send(*args, **kwargs)
+
+    @classmethod
+    async def acknowledge(cls, inter: disnake.Interaction) -> None:
+        deadline = cls.current(inter)
+        if deadline is not None:
+            await deadline.defer()
+        elif not inter.response.is_done():
+            await inter.response.defer()
+
+    async def defer(self) -> None:
+        async with self.lock:
+            if not self.inter.response.is_done():
+                await self.inter.response.defer()
+
+    async def watch(self) -> None:
+        while not self.inter.response.is_done():
+            budget = self.response_remaining - http.predicted_latency(self.usage[self.command]) - DEFER_MARGIN
+            if budget <= 0:
+                try:
+                    await self.defer()
+                except disnake.HTTPException:
+                    pass
+                return
+            await asyncio.sleep(min(budget, 0.25))
+
+    def start(self) -> None:
+        self.task = asyncio.ensure_future(self.watch())
+        http.deadline.set(self)
+
+    def stop(self) -> None:
+        if self.task is not None:
+            self.task.cancel()
+        http.deadline.set(None)
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+from datetime import date
+
+
+def parse_date(value: str) -> date:
+    if value:
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            return None
+
+
+def format_duration(runtime: int) -> str:
+    if runtime:
+        hours, minutes = divmod(runtime, 60)
+        duration = ""
+        if hours != 0:
+            duration += f"{int(hours)}h "
+        if minutes != 0:
+            duration += f"{int(minutes)}min"
+        return duration
+
+
+def format_money(value: int) -> str:
+    if value >= 1000000000:
+        return f"U${value // 1000000000} bi"
+    elif value >= 1000000:
+        return f"U${value // 1000000} mi"
+    elif value >= 1000:
+        return f"U${value // 1000000}k"
+    elif value:
+        return f"U${value}"
+
+
+def providers_by_region(watch_providers: dict, region: str = None) -> dict:
+    results = (watch_providers or {}).get("results") or {}
+    return {
+        key: tuple(provider["provider_name"] for provider in value.get("flatrate") or [])
+        for key, value in results.items()
+        if region is None or key == region
+    }
+
+
+class Entity:
+    __slots__ = ()
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash((type(self).__name__, self.id))
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} id={self.id}>"
@@ -1,15 +1,26 @@
 # -*- coding: utf-8 -*-
-from datetime import date, datetime
-
-
-class Movie(dict):
-    def __init__(self, data: dict) -> None:
-        super().__init__(data)
+from pypoca.ext.entities.base import Entity, format_duration, format_money, parse_date, providers_by_region
+
+
+class Movie(Entity):
+    __slots__ = (
+        "adult", "backdrop_path", "belongs_to_collection", "_budget", "genres", "homepage", "id", "name",
+        "original_language", "original_name", "overview", "popularity", "poster_path", "studios",
+        "production_countries", "release_date", "_revenue", "runtime", "spoken_languages", "_status", "tagline",
+        "video", "vote_average", "vote_count", "alternative_titles", "cast", "crew", "directors", "external_ids",
+        "backdrops", "recommendations", "similar", "youtube_id", "providers", "stale", "version",
+    )
+
+    def __init__(self, data: dict, *, region: str = None) -> None:
+        imdb = data.get("imdb") or {}
+        credits = data.get("credits") or {}
+        images = data.get("images") or {}
+        videos = (data.get("videos") or {}).get("results")
         self.adult = data.get("adult")
         self.backdrop_path = data.get("backdrop_path")
         self.belongs_to_collection = data.get("belongs_to_collection")
         self._budget = int(data.get("budget") or 0)
-        self._genres = data.get("genres") or []
+        self.genres = [genre["name"] for genre in data.get("genres") or []]
         self.homepage = data.get("homepage") or ""
         self.id = data.get("id")
         self.name = data.get("title") or ""
@@ -18,26 +29,32 @@ class Movie(dict):
         self.overview = data.get("overview") or ""
         self.popularity = data.get("popularity")
         self.poster_path = data.get("poster_path")
-        self.production_companies = data.get("production_companies") or []
+        self.studios = [company["name"] for company in data.get("production_companies") or []]
         self.production_countries = data.get("production_countries") or []
-        self._release_date = data.get("release_date")
+        self.release_date = parse_date(data.get("release_date"))
         self._revenue = int(data.get("revenue") or 0)
         self.runtime = data.get("runtime")
         self.spoken_languages = data.get("spoken_languages") or []
         self._status = data.get("status")
         self.tagline = data.get("tagline") or ""
         self.video = data.get("video")
-        self.vote_average = data["imdb"]["imdb_rating"] if data.get("imdb") and data["imdb"].get("imdb_rating") else data.get("vote_average")
-        self.vote_count = data["imdb"]["imdb_votes"] if data.get("imdb") and data["imdb"].get("imdb_votes") else data.get("vote_count")
+        self.vote_average = imdb.get("imdb_rating") or data.get("vote_average")
+        self.vote_count = imdb.get("imdb_votes") or data.get("vote_count")
 
         self.alternative_titles = data.get("alternative_titles") or {}
-        self.credits = data.get("credits") or {}
+        self.cast = credits.get("cast") or []
+        self.crew = credits.get("crew") or []
+        self.directors = [person["name"] for person in self.crew if person.get("job") == "Director"]
         self.external_ids = data.get("external_ids") or {}
-        self.images = data.get("images") or {}
+        self.backdrops = [
+            "https://image.tmdb.org/t/p/w1280/" + backdrop["file_path"] for backdrop in images.get("backdrops") or []
+        ]
         self.recommendations = data["recommendations"]["results"] if data.get("recommendations") else []
         self.similar = data["similar"]["results"] if data.get("similar") else []
-        self.videos = data.get("videos")
-        self.watch_providers = data.get("watch/providers")
+        self.youtube_id = videos[0]["key"] if videos else None
+        self.providers = providers_by_region(data.get("watch/providers"), region)
+        self.stale = data.get("stale", False)
+        self.version = (data.get("fetched_on"), self.vote_average, self.vote_count, self.external_ids.get("trakt_id"), self.stale)
 
     @property
     def title(self) -> str:
@@ -47,11 +64,6 @@ class Movie(dict):
     def title_and_year(self) -> str:
         return f"{self.title[:90]} ({self.release_date.year})" if self.release_date else self.title[:100]
 
-    @property
-    def release_date(self) -> date:
-        if self._release_date:
-            return datetime.strptime(self._release_date, "%Y-%m-%d").date()
-
     @property
     def image(self) -> str:
         if self.backdrop_path:
@@ -64,36 +76,17 @@ class Movie(dict):
 
     @property
     def budget(self) -> str:
-        if self._budget >= 1000000000:
-            return f"U${self._budget // 1000000000} bi"
-        elif self._budget >= 1000000:
-            return f"U${self._budget // 1000000} mi"
-        elif self._budget >= 1000:
-            return f"U${self._budget // 1000000}k"
-        elif self._budget:
-            return f"U${self._budget}"
+        return format_money(self._budget)
 
     @property
     def revenue(self) -> str:
-        if self._revenue >= 1000000000:
-            return f"U${self._revenue // 1000000000} bi"
-        elif self._revenue >= 1000000:
-            return f"U${self._revenue // 1000000} mi"
-        elif self._revenue >= 1000:
-            return f"U${self._revenue // 1000000}k"
-        elif self._revenue:
-            return f"U${self._revenue}"
+        return format_money(self._revenue)
 
     @property
     def imdb_id(self) -> str:
         if self.external_ids.get("imdb_id"):
             return self.external_ids.get("imdb_id")
 
-    @property
-    def youtube_id(self) -> str:
-        if self.videos and self.videos["results"]:
-            return self.videos["results"][0]["key"]
-
     @property
     def trakt_id(self) -> str:
         if self.external_ids.get("trakt_id"):
@@ -111,56 +104,21 @@ class Movie(dict):
     def status(self) -> str:
         return self._status.replace(" ", "_").upper()
 
-    @property
-    def backdrops(self) -> list[str]:
-        return [
-            f"https://image.tmdb.org/t/p/w1280/" + backdrop["file_path"] for backdrop in self.images.get("backdrops") or []
-        ]
-
-    @property
-    def cast(self) -> dict:
-        return self.credits.get("cast") or []
-
-    @property
-    def crew(self) -> dict:
-        return self.credits.get("crew") or []
-
     @property
     def duration(self) -> str:
-        if self.runtime:
-            hours, minutes = divmod(self.runtime, 60)
-            duration = ""
-            if hours != 0:
-                duration += f"{int(hours)}h "
-            if minutes != 0:
-                duration += f"{int(minutes)}min"
-            return duration
+        return format_duration(self.runtime)
 
     @property
     def rating_and_votes(self) -> str:
         if self.vote_average and self.vote_count:
             return f"{self.vote_average} ({self.vote_count})"
 
-    @property
-    def directors(self) -> list[str]:
-        return [person["name"] for person in self.crew if person["job"] == "Director"]
-
-    @property
-    def genres(self) -> list[str]:
-        return [genre["name"] for genre in self._genres]
-
-    @property
-    def studios(self) -> list[str]:
-        return [company["name"] for company in self.production_companies]
-
     def watch_on(self, region: str) -> list[str]:
-        if self.watch_providers.get("results") and self.watch_providers["results"].get(region) and self.watch_providers["results"][region].get("flatrate"):
-            providers = [provider["provider_name"] for provider in self.watch_providers["results"][region]["flatrate"]]
-            if self.trakt_id:
-                trakt_url = "https://trakt.tv/watchnow/movie"
-                providers = [
-                    f"[{provider}]({trakt_url}/{self.trakt_id}/1/{region}/{provider.replace(' ', '_').lower()})"
-                    for provider in providers
-                ]
-            return providers
-        return []
+        providers = list(self.providers.get(region) or [])
+        if providers and self.trakt_id:
+            trakt_url = "https://trakt.tv/watchnow/movie"
+            providers = [
+                f"[{provider}]({trakt_url}/{self.trakt_id}/1/{region}/{provider.replace(' ', '_').lower()})"
+                for provider in providers
+            ]
+        return providers
@@ -1,19 +1,24 @@
 # -*- coding: utf-8 -*-
-from datetime import date, datetime
+from pypoca.ext.entities.base import Entity, parse_date
 
 
-class Person(dict):
+class Person(Entity):
+    __slots__ = (
+        "adult", "also_known_as", "biography", "birthday", "deathday", "gender", "homepage", "id", "jobs",
+        "known_for_department", "name", "place_of_birth", "popularity", "profile_path", "external_ids", "cast",
+        "crew", "cast_movies", "cast_shows", "crew_movies", "crew_shows", "stale", "version",
+    )
+
     def __init__(self, data: dict) -> None:
-        super().__init__(data)
+        credits = data.get("combined_credits") or {}
         self.adult = data.get("adult")
         self.also_known_as = data.get("also_known_as")
         self.biography = data.get("biography", "")
-        self._birthday = data.get("birthday")
-        self._deathday = data.get("deathday")
+        self.birthday = parse_date(data.get("birthday"))
+        self.deathday = parse_date(data.get("deathday"))
         self.gender = data.get("gender")
         self.homepage = data.get("homepage")
         self.id = data.get("id")
-        self._known_for = data.get("known_for")
         self.known_for_department = data.get("known_for_department")
         self.name = data.get("name", "")
         self.place_of_birth = data.get("place_of_birth")
@@ -21,17 +26,19 @@ class Person(dict):
         self.profile_path = data.get("profile_path")
 
         self.external_ids = data.get("external_ids") or {}
-        self.credits = data.get("combined_credits") or {}
-
-    @property
-    def birthday(self) -> date:
-        if self._birthday:
-            return datetime.strptime(self._birthday, "%Y-%m-%d").date()
-
-    @property
-    def deathday(self) -> date:
-        if self._deathday:
-            return datetime.strptime(self._deathday, "%Y-%m-%d").date()
+        self.cast = credits.get("cast") or []
+        self.crew = credits.get("crew") or []
+        self.cast_movies = [cast for cast in self.cast if cast["media_type"] == "movie"]
+        self.cast_shows = [cast for cast in self.cast if cast["media_type"] == "tv"]
+        self.crew_movies = [crew for crew in self.crew if crew["media_type"] == "movie"]
+        self.crew_shows = [crew for crew in self.crew if crew["media_type"] == "tv"]
+        jobs = data.get("known_for") or (self.cast if self.known_for_department == "Acting" else self.crew)
+        self.jobs = [
+            job.get("title") or job.get("name") or job.get("original_title") or job.get("original_name")
+            for job in jobs
+        ]
+        self.stale = data.get("stale", False)
+        self.version = (data.get("fetched_on"), self.stale)
 
     @property
     def image(self) -> str:
@@ -64,35 +71,3 @@ class Person(dict):
     @property
     def twitter(self) -> str:
         return f"https://www.twitter.com/{self.twitter_id}"
-
-    @property
-    def cast(self) -> list[dict]:
-        return self.credits.get("cast") or []
-
-    @property
-    def cast_movies(self) -> list[dict]:
-        return [cast for cast in self.cast if cast["media_type"] == "movie"]
-
-    @property
-    def cast_shows(self) -> list[dict]:
-        return [cast for cast in self.cast if cast["media_type"] == "tv"]
-
-    @property
-    def crew(self) -> list[dict]:
-        return self.credits.get("crew") or []
-
-    @property
-    def crew_movies(self) -> list[dict]:
-        return [crew for crew in self.crew if crew["media_type"] == "movie"]
-
-    @property
-    def crew_shows(self) -> list[dict]:
-        return [crew for crew in self.crew if crew["media_type"] == "tv"]
-
-    @property
-    def jobs(self) -> list[str]:
-        jobs = self._known_for or (self.cast if self.known_for_department == "Acting" else self.crew)
-        return [
-            job.get("title") or job.get("name") or job.get("original_title") or job.get("original_name")
-            for job in jobs
-        ]
@@ -1,24 +1,36 @@
 # -*- coding: utf-8 -*-
-from datetime import date, datetime
-
-
-class Show(dict):
-    def __init__(self, data: dict) -> None:
-        super().__init__(data)
+from pypoca.ext.entities.base import Entity, format_duration, parse_date, providers_by_region
+
+
+class Show(Entity):
+    __slots__ = (
+        "backdrop_path", "directors", "episode_run_time", "first_date", "genres", "homepage", "id", "in_production",
+        "languages", "last_date", "last_episode_to_air", "name", "next_episode_to_air", "studios",
+        "number_of_episodes", "number_of_seasons", "origin_country", "original_language", "original_name",
+        "overview", "popularity", "poster_path", "production_companies", "production_countries", "seasons",
+        "spoken_languages", "_status", "tagline", "type", "vote_average", "vote_count", "alternative_titles", "cast",
+        "crew", "external_ids", "backdrops", "recommendations", "similar", "youtube_id", "providers", "stale", "version",
+    )
+
+    def __init__(self, data: dict, *, region: str = None) -> None:
+        imdb = data.get("imdb") or {}
+        credits = data.get("credits") or {}
+        images = data.get("images") or {}
+        videos = (data.get("videos") or {}).get("results")
         self.backdrop_path = data.get("backdrop_path")
-        self.created_by = data.get("created_by") or []
+        self.directors = [person["name"] for person in data.get("created_by") or []]
         self.episode_run_time = data.get("episode_run_time") or []
-        self.first_air_date = data.get("first_air_date")
-        self._genres = data.get("genres") or []
+        self.first_date = parse_date(data.get("first_air_date"))
+        self.genres = [genre["name"] for genre in data.get("genres") or []]
         self.homepage = data.get("homepage") or ""
         self.id = data.get("id")
         self.in_production = data.get("in_production")
         self.languages = data.get("languages") or []
-        self.last_air_date = data.get("last_air_date")
+        self.last_date = parse_date(data.get("last_air_date"))
         self.last_episode_to_air = data.get("last_episode_to_air")
         self.name = data.get("name") or ""
         self.next_episode_to_air = data.get("next_episode_to_air")
-        self.networks = data.get("networks") or []
+        self.studios = [network["name"] for network in data.get("networks") or []]
         self.number_of_episodes = data.get("number_of_episodes") or 0
         self.number_of_seasons = data.get("number_of_seasons") or 0
         self.origin_country = data.get("origin_country") or []
@@ -34,17 +46,22 @@ class Show(dict):
         self._status = data.get("status") or ""
         self.tagline = data.get("tagline") or ""
         self.type = data.get("type")
-        self.vote_average = data["imdb"]["imdb_rating"] if data.get("imdb") and data["imdb"].get("imdb_rating") else data.get("vote_average")
-        self.vote_count = data["imdb"]["imdb_votes"] if data.get("imdb") and data["imdb"].get("imdb_votes") else data.get("vote_count")
+        self.vote_average = imdb.get("imdb_rating") or data.get("vote_average")
+        self.vote_count = imdb.get("imdb_votes") or data.get("vote_count")
 
         self.alternative_titles = data.get("alternative_titles") or {}
-        self.credits = data.get("credits") or {}
+        self.cast = credits.get("cast") or []
+        self.crew = credits.get("crew") or []
         self.external_ids = data.get("external_ids") or {}
-        self.images = data.get("images") or {}
+        self.backdrops = [
+            "https://image.tmdb.org/t/p/w1280/" + backdrop["file_path"] for backdrop in images.get("backdrops") or []
+        ]
         self.recommendations = data["recommendations"]["results"] if data.get("recommendations") else []
         self.similar = data["similar"]["results"] if data.get("similar") else []
-        self.videos = data.get("videos")
-        self.watch_providers = data.get("watch/providers")
+        self.youtube_id = videos[0]["key"] if videos else None
+        self.providers = providers_by_region(data.get("watch/providers"), region)
+        self.stale = data.get("stale", False)
+        self.version = (data.get("fetched_on"), self.vote_average, self.vote_count, self.external_ids.get("trakt_id"), self.stale)
 
     @property
     def title(self) -> str:
@@ -52,23 +69,13 @@ class Show(dict):
 
     @property
     def title_and_year(self) -> str:
-        if self.first_date and self._status in ("Ended", "Canceled") and self.last_air_date:
+        if self.first_date and self._status in ("Ended", "Canceled") and self.last_date:
             return f"{self.title[:90]} ({self.first_date.year}-{self.last_date.year})"
         elif self.first_date:
             return f"{self.title[:90]} ({self.first_date.year})"
         else:
             return self.title[:100]
 
-    @property
-    def first_date(self) -> date:
-        if self.first_air_date:
-            return datetime.strptime(self.first_air_date, "%Y-%m-%d").date()
-
-    @property
-    def last_date(self) -> date:
-        if self.last_air_date:
-            return datetime.strptime(self.last_air_date, "%Y-%m-%d").date()
-
     @property
     def image(self) -> str:
         if self.backdrop_path:
@@ -84,11 +91,6 @@ class Show(dict):
         if self.external_ids.get("imdb_id"):
             return self.external_ids.get("imdb_id")
 
-    @property
-    def youtube_id(self) -> str:
-        if self.videos and self.videos["results"]:
-            return self.videos["results"][0]["key"]
-
     @property
     def trakt_id(self) -> str:
         if self.external_ids.get("trakt_id"):
@@ -106,39 +108,18 @@ class Show(dict):
     def status(self) -> str:
         return self._status.replace(" ", "_").upper()
 
-    @property
-    def cast(self) -> dict:
-        return self.credits.get("cast") or []
-
-    @property
-    def crew(self) -> dict:
-        return self.credits.get("crew") or []
-
     @property
     def runtime_per_episode(self) -> int:
         return int(sum(self.episode_run_time) / len(self.episode_run_time)) if self.episode_run_time else 0
 
     @property
     def duration_per_episode(self) -> str:
-        if self.runtime_per_episode:
-            hours, minutes = divmod(self.runtime_per_episode, 60)
-            duration = ""
-            if hours != 0:
-                duration += f"{int(hours)}h "
-            if minutes != 0:
-                duration += f"{int(minutes)}min"
-            return duration
+        return format_duration(self.runtime_per_episode)
 
     @property
     def duration_total(self) -> str:
         if self.runtime_per_episode and self.number_of_episodes:
-            hours, minutes = divmod(self.runtime_per_episode * self.number_of_episodes, 60)
-            duration = ""
-            if hours != 0:
-                duration += f"{int(hours)}h "
-            if minutes != 0:
-                duration += f"{int(minutes)}min"
-            return duration
+            return format_duration(self.runtime_per_episode * self.number_of_episodes)
 
     @property
     def duration(self) -> str:
@@ -152,26 +133,12 @@ class Show(dict):
         if self.vote_average and self.vote_count:
             return f"{self.vote_average} ({self.vote_count})"
 
-    @property
-    def directors(self) -> list[str]:
-        return [person["name"] for person in self.created_by]
-
-    @property
-    def genres(self) -> list[str]:
-        return [genre["name"] for genre in self._genres]
-
-    @property
-    def studios(self) -> list[str]:
-        return [network["name"] for network in self.networks]
-
     def watch_on(self, region: str) -> list[str]:
-        if self.watch_providers.get("results") and self.watch_providers["results"].get(region) and self.watch_providers["results"][region].get("flatrate"):
-            providers = [provider["provider_name"] for provider in self.watch_providers["results"][region]["flatrate"]]
-            if self.trakt_id:
-                trakt_url = "https://trakt.tv/watchnow/show"
-                providers = [
-                    f"[{provider}]({trakt_url}/{self.trakt_id}/1/{region}/{provider.replace(' ', '_').lower()})"
-                    for provider in providers
-                ]
-            return providers
-        return []
+        providers = list(self.providers.get(region) or [])
+        if providers and self.trakt_id:
+            trakt_url = "https://trakt.tv/watchnow/show"
+            providers = [
+                f"[{provider}]({trakt_url}/{self.trakt_id}/1/{region}/{provider.replace(' ', '_').lower()})"
+                for provider in providers
+            ]
+        return providers
@@ -2,10 +2,11 @@
 import json
 import os
 
+LOCALE = os.path.join(os.path.dirname(os.path.dirname(__file__)), "locale")
 ALL = {}
 
-for filename in os.listdir("pypoca/locale"):
-    with open(f"pypoca/locale/{filename}", "r") as file:
+for filename in os.listdir(LOCALE):
+    with open(os.path.join(LOCALE, filename), "r") as file:
         ALL[filename[:-5]] = json.load(file)
 
 DEFAULT_LANGUAGE = "en_US"
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+import importlib.util
+import os
+import subprocess
+import sys
+from types import ModuleType
+
+COGS = os.path.join(os.path.dirname(__file__), "cogs")
+
+
+def lazy_import(name: str) -> ModuleType:
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def cogs() -> list[str]:
+    return [
+        f"pypoca.cogs.{filename[:-3]}"
+        for filename in sorted(os.listdir(COGS))
+        if filename.endswith(".py") and not filename.startswith("_")
+    ]
+
+
+def report(modules: list[str], *, limit: int = 20) -> list[tuple[str, int, int]]:
+    code = "; ".join(f"import {module}" for module in modules)
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True)
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr.strip().splitlines()[-1])
+    timings = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        timings.append((name.strip(), int(cumulative), int(own)))
+    return sorted(timings, key=lambda timing: timing[1], reverse=True)[:limit]
+
+
+def main() -> None:
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    for name, cumulative, own in report(["pypoca.bot", *cogs()]):
+        print(f"{cumulative / 1000:>10.1f}ms {own / 1000:>8.1f}ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
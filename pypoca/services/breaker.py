@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+import time
+
+
+class CircuitBreaker:
+    def __init__(self, *, failures: int, reset_timeout: float) -> None:
+        self.failures = failures
+        self.reset_timeout = reset_timeout
+        self.count = 0
+        self.opened_on = None
+        self.probed_on = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_on is None:
+            return "closed"
+        if time.monotonic() - self.opened_on < self.reset_timeout:
+            return "open"
+        return "half_open"
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open":
+            now = time.monotonic()
+            if self.probed_on is None or now - self.probed_on >= self.reset_timeout:
+                self.probed_on = now
+                return True
+        return False
+
+    def success(self) -> None:
+        self.count = 0
+        self.opened_on = None
+        self.probed_on = None
+
+    def failure(self) -> None:
+        self.count += 1
+        self.probed_on = None
+        if self.opened_on is not None or self.count >= self.failures:
+            self.opened_on = time.monotonic()
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from pypoca.services import payload
+
+
+class TTLCache:
+    def __init__(self, *, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: tuple) -> bool:
+        item = self._data.get(key)
+        return item is not None and item[0] > time.monotonic()
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "size": len(self),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+        }
+
+    def get(self, key: tuple, default: object = None) -> object:
+        value, stale = self.lookup(key)
+        return default if value is None else value
+
+    def lookup(self, key: tuple, *, max_stale: float = 0) -> tuple[object, bool]:
+        item = self._data.get(key)
+        now = time.monotonic()
+        if item is None or item[0] + max_stale <= now:
+            self.misses += 1
+            return None, False
+        self._data.move_to_end(key)
+        if item[0] <= now:
+            self.stale_hits += 1
+            return item[1], True
+        self.hits += 1
+        return item[1], False
+
+    def set(self, key: tuple, value: object, *, ttl: float) -> None:
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: tuple) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class DiskCache:
+    def __init__(self, *, path: str, maxsize: int) -> None:
+        self.path = path
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._connection = None
+        self._lock = threading.Lock()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, expires_on REAL, accessed_on REAL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS cache_accessed_on ON cache (accessed_on)")
+        return self._connection
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            size = self.connection.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        return {"size": size, "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+    def get(self, key: str) -> object:
+        now = time.time()
+        with self._lock:
+            row = self.connection.execute("SELECT value, expires_on FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None or row[1] <= now:
+                self.misses += 1
+                return None
+            self.connection.execute("UPDATE cache SET accessed_on = ? WHERE key = ?", (now, key))
+        self.hits += 1
+        return payload.loads(row[0])
+
+    def set(self, key: str, value: object, *, ttl: float) -> None:
+        now = time.time()
+        data = payload.dumps(value)
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_on, accessed_on) VALUES (?, ?, ?, ?)",
+                (key, data, now + ttl, now),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self.connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def compact(self) -> None:
+        with self._lock:
+            self.connection.execute("DELETE FROM cache WHERE expires_on <= ?", (time.time(),))
+            self.connection.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY accessed_on DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            )
+            self.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self.connection.execute("VACUUM")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+            self._connection = None
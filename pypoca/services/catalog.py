@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+import asyncio
+
+from pypoca.log import log
+from pypoca.services import tmdb
+
+SERVICES = {
+    "movie": tmdb.Movies,
+    "tv": tmdb.Shows,
+}
+
+
+class Lookup:
+    __slots__ = ("names", "ids")
+
+    def __init__(self, items: list[tuple[int, str]]) -> None:
+        self.names = {id: name for id, name in items}
+        self.ids = {name.casefold(): id for id, name in items}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, id: int) -> bool:
+        return id in self.names
+
+    def name(self, id: int) -> str:
+        return self.names.get(id)
+
+    def id(self, name: str) -> int:
+        return self.ids.get(name.casefold())
+
+
+class Catalog:
+    def __init__(self) -> None:
+        self.genres = {}
+        self.providers = {}
+
+    def genre(self, media_type: str, *, language: str) -> Lookup:
+        return self.genres.get((media_type, language))
+
+    def provider(self, media_type: str, *, region: str) -> Lookup:
+        return self.providers.get((media_type, region))
+
+    def available(self, media_type: str, *, region: str, providers: str) -> str:
+        lookup = self.provider(media_type, region=region)
+        if lookup is None or providers is None:
+            return providers
+        return "|".join(id for id in providers.split("|") if int(id) in lookup)
+
+    async def load_genres(self, media_type: str, *, language: str) -> None:
+        response = await SERVICES[media_type](language=language).genres()
+        self.genres[(media_type, language)] = Lookup([(genre["id"], genre["name"]) for genre in response["genres"]])
+
+    async def load_providers(self, media_type: str, *, region: str) -> None:
+        response = await SERVICES[media_type](region=region).providers()
+        self.providers[(media_type, region)] = Lookup(
+            [(provider["provider_id"], provider["provider_name"]) for provider in response["results"]]
+        )
+
+    async def refresh(self, *, languages: list[str], regions: list[str]) -> None:
+        loads = [
+            *(self.load_genres(media_type, language=language) for media_type in SERVICES for language in languages),
+            *(self.load_providers(media_type, region=region) for media_type in SERVICES for region in regions),
+        ]
+        for result in await asyncio.gather(*loads, return_exceptions=True):
+            if isinstance(result, Exception):
+                log.warning(f"Failed to refresh catalog. {result}")
+
+
+catalog = Catalog()
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from typing import Awaitable
+
+from pypoca.config import ENRICHMENT_TIMEOUT, EXTERNAL_ID_CACHE
+from pypoca.database import ExternalId
+from pypoca.log import log
+from pypoca.services import omdb, tmdb, trakt
+from pypoca.services.cache import TTLCache
+
+APPEND = "credits,external_ids,recommendations,similar,videos,watch/providers"
+FIELDS = ("trakt_id", "imdb_id", "imdb_rating", "imdb_votes")
+
+SAVING = set()
+
+mappings = TTLCache(maxsize=EXTERNAL_ID_CACHE["maxsize"])
+
+SERVICES = {
+    "movie": (tmdb.Movie, trakt.Movie, omdb.Movie),
+    "tv": (tmdb.Show, trakt.Show, omdb.Show),
+}
+
+
+async def optional(awaitable: Awaitable, *, timeout: float, default: object = None) -> object:
+    try:
+        return await asyncio.wait_for(awaitable, timeout=timeout)
+    except Exception:
+        return default
+
+
+async def ratings(omdb_service: type, imdb_id: str, *, default: dict) -> dict:
+    imdb = await optional(omdb_service().ratings_by_imdb_id(imdb_id), timeout=ENRICHMENT_TIMEOUT["omdb"], default=default)
+    return imdb if imdb.get("imdb_rating") is not None else default
+
+
+def as_mapping(external_id: object) -> dict:
+    return {field: getattr(external_id, field) for field in FIELDS} if external_id else {}
+
+
+async def lookup(id: int, *, media_type: str) -> dict:
+    mapping = mappings.get((media_type, id))
+    if mapping is None:
+        external_id = await optional(
+            ExternalId.get_by_tmdb_id(id, media_type=media_type), timeout=ENRICHMENT_TIMEOUT["database"]
+        )
+        mapping = as_mapping(external_id)
+        if mapping:
+            mappings.set((media_type, id), mapping, ttl=EXTERNAL_ID_CACHE["ttl"])
+    return mapping
+
+
+async def preload(media_type: str, ids: list[int]) -> None:
+    ids = [id for id in dict.fromkeys(ids) if (media_type, id) not in mappings]
+    if not ids:
+        return
+    try:
+        external_ids = await ExternalId.get_by_tmdb_ids(ids, media_type=media_type)
+    except Exception as e:
+        log.warning(f"Failed to preload external ids for {len(ids)} {media_type} titles. {e}")
+        return
+    for id in ids:
+        mappings.set((media_type, id), as_mapping(external_ids.get(id)), ttl=EXTERNAL_ID_CACHE["ttl"])
+
+
+async def save(id: int, *, media_type: str, data: dict) -> None:
+    try:
+        await ExternalId.update_or_create(tmdb_id=id, media_type=media_type, data=data)
+    except Exception as e:
+        log.warning(f"Failed to save external ids for {media_type} {id}. {e}")
+        return
+    mapping = {**mappings.get((media_type, id), {}), **data}
+    mappings.set((media_type, id), {field: mapping.get(field) for field in FIELDS}, ttl=EXTERNAL_ID_CACHE["ttl"])
+
+
+async def details(media_type: str, id: int, *, language: str, region: str) -> dict:
+    tmdb_service, trakt_service, omdb_service = SERVICES[media_type]
+    tmdb_task = asyncio.ensure_future(tmdb_service(id=id, language=language, region=region).details(append=APPEND))
+    trakt_task = imdb_task = None
+    try:
+        mapping = await lookup(id, media_type=media_type)
+        snapshot = {"imdb_rating": mapping.get("imdb_rating"), "imdb_votes": mapping.get("imdb_votes")}
+        if not mapping.get("trakt_id") and trakt_service.upstream.available:
+            trakt_task = asyncio.ensure_future(
+                optional(trakt_service().trakt_id_by_tmdb_id(id), timeout=ENRICHMENT_TIMEOUT["trakt"])
+            )
+        omdb_available = omdb_service.upstream.available
+        if mapping.get("imdb_id") and omdb_available:
+            imdb_task = asyncio.ensure_future(ratings(omdb_service, mapping["imdb_id"], default=snapshot))
+        result = await tmdb_task
+    except BaseException:
+        for task in (tmdb_task, trakt_task, imdb_task):
+            if task is not None:
+                task.cancel()
+        raise
+
+    external_ids = result.get("external_ids") or {}
+    if imdb_task is None and external_ids.get("imdb_id") and omdb_available:
+        imdb_task = asyncio.ensure_future(ratings(omdb_service, external_ids["imdb_id"], default=snapshot))
+    trakt_id = await trakt_task if trakt_task is not None else mapping.get("trakt_id")
+    imdb = await imdb_task if imdb_task is not None else snapshot
+
+    data = {
+        "trakt_id": trakt_id,
+        "imdb_id": external_ids.get("imdb_id"),
+        "imdb_rating": imdb["imdb_rating"],
+        "imdb_votes": imdb["imdb_votes"],
+    }
+    data = {k: v for k, v in data.items() if v is not None and mapping.get(k) != v}
+    if data:
+        task = asyncio.ensure_future(save(id, media_type=media_type, data=data))
+        SAVING.add(task)
+        task.add_done_callback(SAVING.discard)
+    return {
+        **result,
+        "external_ids": {**external_ids, "trakt_id": trakt_id},
+        "imdb": imdb,
+        "stale": result.get("stale", False) or imdb.get("stale", False),
+    }
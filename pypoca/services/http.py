@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Awaitable, Iterable
+
+from aiohttp import ClientConnectionError, ClientResponse, ClientResponseError, ClientSession, ClientTimeout, TCPConnector
+
+from pypoca.config import HTTP_SETTINGS, RATE_LIMIT_RETRIES, RATE_LIMITS, UPSTREAMS
+from pypoca.exceptions import CircuitOpenException, DeadlineException, RequestException
+from pypoca.services.breaker import CircuitBreaker
+from pypoca.services.ratelimit import RateLimiter
+
+deadline = ContextVar("deadline", default=None)
+
+
+def is_transient(error: BaseException) -> bool:
+    if isinstance(error, RequestException) and error.args:
+        error = error.args[0]
+    if isinstance(error, ClientResponseError):
+        return error.status >= 500 or error.status == 429
+    return isinstance(error, (asyncio.TimeoutError, ClientConnectionError, CircuitOpenException, DeadlineException))
+
+
+def predicted_latency(names: Iterable[str]) -> float:
+    return max((upstream.latency.predict() for upstream in Upstream.instances if upstream.name in names), default=0.0)
+
+
+def detach(awaitable: Awaitable) -> asyncio.Future:
+    async def run() -> object:
+        deadline.set(None)
+        return await awaitable
+
+    return asyncio.ensure_future(run())
+
+
+class Latency:
+    def __init__(self, *, size: int = 100, quantile: float = 0.9) -> None:
+        self.samples = deque(maxlen=size)
+        self.quantile = quantile
+
+    def record(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def predict(self) -> float:
+        if not self.samples:
+            return 0.0
+        samples = sorted(self.samples)
+        return samples[min(int(len(samples) * self.quantile), len(samples) - 1)]
+
+
+class Upstream:
+    instances = []
+
+    def __init__(self, name: str) -> None:
+        settings = UPSTREAMS[name]
+        self.instances.append(self)
+        self.name = name
+        self.latency = Latency()
+        self.concurrency = settings["concurrency"]
+        self.limiter = RateLimiter(**RATE_LIMITS[name])
+        self.breaker = CircuitBreaker(failures=settings["failures"], reset_timeout=settings["reset_timeout"])
+        self.timeout = ClientTimeout(
+            total=settings["connect_timeout"] + settings["read_timeout"],
+            sock_connect=settings["connect_timeout"],
+            sock_read=settings["read_timeout"],
+        )
+        self._semaphore = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    @property
+    def available(self) -> bool:
+        return not self.breaker.is_open
+
+    @property
+    def current_timeout(self) -> ClientTimeout:
+        current = deadline.get()
+        if current is None or current.remaining >= self.timeout.total:
+            return self.timeout
+        if current.remaining <= 0:
+            raise DeadlineException(self.name)
+        return ClientTimeout(total=current.remaining, sock_connect=self.timeout.sock_connect, sock_read=self.timeout.sock_read)
+
+    def failure(self, error: BaseException, *, timeout: ClientTimeout, elapsed: float) -> None:
+        if isinstance(error, asyncio.TimeoutError):
+            if timeout is not self.timeout:
+                raise DeadlineException(self.name) from error
+            self.latency.record(elapsed)
+        self.breaker.failure()
+
+
+class HTTPClient:
+    def __init__(self, *, settings: dict = HTTP_SETTINGS) -> None:
+        self.settings = settings
+        self._session = None
+
+    @property
+    def session(self) -> ClientSession:
+        if self._session is None or self._session.closed:
+            self.open()
+        return self._session
+
+    def open(self) -> None:
+        connector = TCPConnector(
+            limit=self.settings["limit"],
+            limit_per_host=self.settings["limit_per_host"],
+            keepalive_timeout=self.settings["keepalive_timeout"],
+            ttl_dns_cache=self.settings["ttl_dns_cache"],
+        )
+        timeout = ClientTimeout(
+            total=self.settings["total_timeout"],
+            sock_connect=self.settings["connect_timeout"],
+            sock_read=self.settings["read_timeout"],
+        )
+        self._session = ClientSession(connector=connector, timeout=timeout)
+
+    @asynccontextmanager
+    async def request(
+        self, method: str, url: str, *, upstream: Upstream = None, retries: int = RATE_LIMIT_RETRIES, **kwargs
+    ) -> AsyncIterator[ClientResponse]:
+        if upstream is None:
+            async with self.session.request(method, url, **kwargs) as response:
+                yield response
+            return
+        if not upstream.breaker.allow():
+            raise CircuitOpenException(upstream.name)
+        current = deadline.get()
+        if current is not None:
+            current.observe(upstream.name)
+        started_on = time.monotonic()
+        timeout = upstream.timeout
+        async with upstream.semaphore:
+            try:
+                for attempt in range(retries + 1):
+                    await upstream.limiter.acquire()
+                    timeout = upstream.current_timeout
+                    response = await self.session.request(method, url, timeout=timeout, **kwargs)
+                    upstream.limiter.update(response.status, response.headers)
+                    if response.status != 429 or attempt == retries:
+                        break
+                    response.release()
+            except (asyncio.TimeoutError, ClientConnectionError) as e:
+                upstream.failure(e, timeout=timeout, elapsed=time.monotonic() - started_on)
+                raise
+            upstream.breaker.failure() if response.status >= 500 else upstream.breaker.success()
+            try:
+                yield response
+            except (asyncio.TimeoutError, ClientConnectionError) as e:
+                upstream.failure(e, timeout=timeout, elapsed=time.monotonic() - started_on)
+                raise
+            else:
+                upstream.latency.record(time.monotonic() - started_on)
+            finally:
+                response.release()
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+client = HTTPClient()
@@ -1,11 +1,18 @@
 # -*- coding: utf-8 -*-
-from aiohttp import ClientSession
+import asyncio
 
-from pypoca.config import OMDB_KEY
+from pypoca.config import OMDB_CACHE, OMDB_KEY
 from pypoca.exceptions import OMDbException
+from pypoca.services import http, payload
+from pypoca.services.cache import TTLCache
+from pypoca.services.singleflight import SingleFlight
 
 
 class OMDb:
+    cache = TTLCache(maxsize=OMDB_CACHE["maxsize"])
+    flights = SingleFlight()
+    upstream = http.Upstream("omdb")
+
     @property
     def host(self) -> str:
         return "http://www.omdbapi.com"
@@ -23,16 +30,36 @@ class OMDb:
     async def request(self, path: str, method: str = "GET", **kwargs) -> dict:
         url = f"{self.host}/{path}"
         params = {**self.default_params, **kwargs}
+        key = (method, path, tuple(sorted(kwargs.items())))
+        cached, stale = self.cache.lookup(key, max_stale=OMDB_CACHE["max_stale"])
+        if cached is not None and not stale:
+            return cached
+        if cached is not None and OMDB_CACHE["stale_while_revalidate"]:
+            http.detach(self.revalidate(key, method, url, params))
+            return {**cached, "stale": True}
+        try:
+            result = await self.flights.do(key, lambda: self.fetch(method, url, params))
+        except OMDbException as e:
+            if cached is None or not http.is_transient(e):
+                raise
+            return {**cached, "stale": True}
+        self.cache.set(key, result, ttl=OMDB_CACHE["ttl"])
+        return result
 
-        async with ClientSession() as session:
-            async with await session.request(method, url=url, params=params) as response:
-                try:
-                    response.raise_for_status()
-                    result = await response.json()
-                except Exception as e:
-                    raise OMDbException(e)
-                else:
-                    return result
+    async def revalidate(self, key: tuple, method: str, url: str, params: dict) -> None:
+        try:
+            result = await self.flights.do(key, lambda: self.fetch(method, url, params))
+        except OMDbException:
+            return
+        self.cache.set(key, result, ttl=OMDB_CACHE["ttl"])
+
+    async def fetch(self, method: str, url: str, params: dict) -> dict:
+        try:
+            async with http.client.request(method, url, upstream=self.upstream, params=params) as response:
+                response.raise_for_status()
+                return payload.project(payload.loads(await response.read()), payload.OMDB_TITLE)
+        except Exception as e:
+            raise OMDbException(e)
 
 
 class Movie(OMDb):
@@ -42,7 +69,11 @@ class Movie(OMDb):
     async def ratings_by_imdb_id(self, imdb_id: str) -> str:
         try:
             response = await self.find_by_imdb_id(imdb_id)
-            return {"imdb_rating": float(response["imdbRating"]), "imdb_votes": int(response["imdbVotes"].replace(",", ""))}
+            return {
+                "imdb_rating": float(response["imdbRating"]),
+                "imdb_votes": int(response["imdbVotes"].replace(",", "")),
+                "stale": response.get("stale", False),
+            }
         except Exception:
             return {"imdb_rating": None, "imdb_votes": None}
 
@@ -54,6 +85,10 @@ class Show(OMDb):
     async def ratings_by_imdb_id(self, imdb_id: str) -> str:
         try:
             response = await self.find_by_imdb_id(imdb_id)
-            return {"imdb_rating": float(response["imdbRating"]), "imdb_votes": int(response["imdbVotes"].replace(",", ""))}
+            return {
+                "imdb_rating": float(response["imdbRating"]),
+                "imdb_votes": int(response["imdbVotes"].replace(",", "")),
+                "stale": response.get("stale", False),
+            }
         except Exception:
             return {"imdb_rating": None, "imdb_votes": None}
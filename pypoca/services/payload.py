@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+import json
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: bytes) -> object:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value: object) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, separators=(",", ":"))
+
+
+def fields(*names: str, **nested: object) -> dict:
+    return {**{name: True for name in names}, **nested}
+
+
+MOVIE_ITEM = fields(
+    "adult", "backdrop_path", "genre_ids", "id", "media_type", "original_language", "original_title",
+    "overview", "popularity", "poster_path", "release_date", "title", "vote_average", "vote_count",
+)
+SHOW_ITEM = fields(
+    "backdrop_path", "first_air_date", "genre_ids", "id", "media_type", "name", "origin_country",
+    "original_language", "original_name", "overview", "popularity", "poster_path", "vote_average", "vote_count",
+)
+CREDIT_ITEM = MOVIE_ITEM | SHOW_ITEM | fields("character", "department", "gender", "job", "known_for_department")
+PERSON_ITEM = fields(
+    "adult", "character", "department", "gender", "id", "job", "known_for_department", "name", "popularity",
+    "profile_path", known_for=MOVIE_ITEM | SHOW_ITEM,
+)
+PAGE = {"page": True, "total_pages": True, "total_results": True}
+MEDIA = fields(
+    "alternative_titles", "external_ids",
+    credits=fields(cast=PERSON_ITEM, crew=PERSON_ITEM),
+    images=fields(backdrops=fields("file_path"), posters=fields("file_path")),
+    videos=fields(results=fields("key", "name", "site", "type")),
+    **{"watch/providers": fields(results={"*": fields("link", flatrate=fields("provider_id", "provider_name"))})},
+)
+
+PROJECTIONS = [
+    (re.compile(r"^movie/\d+$"), fields(
+        "adult", "backdrop_path", "belongs_to_collection", "budget", "genres", "homepage", "id", "imdb_id",
+        "original_language", "original_title", "overview", "popularity", "poster_path", "production_companies",
+        "production_countries", "release_date", "revenue", "runtime", "spoken_languages", "status", "tagline",
+        "title", "video", "vote_average", "vote_count",
+        recommendations=fields(results=MOVIE_ITEM, **PAGE), similar=fields(results=MOVIE_ITEM, **PAGE), **MEDIA,
+    )),
+    (re.compile(r"^tv/\d+$"), fields(
+        "backdrop_path", "created_by", "episode_run_time", "first_air_date", "genres", "homepage", "id",
+        "in_production", "languages", "last_air_date", "last_episode_to_air", "name", "networks",
+        "next_episode_to_air", "number_of_episodes", "number_of_seasons", "origin_country", "original_language",
+        "original_name", "overview", "popularity", "poster_path", "production_companies", "production_countries",
+        "seasons", "spoken_languages", "status", "tagline", "type", "vote_average", "vote_count",
+        recommendations=fields(results=SHOW_ITEM, **PAGE), similar=fields(results=SHOW_ITEM, **PAGE), **MEDIA,
+    )),
+    (re.compile(r"^person/\d+$"), fields(
+        "adult", "also_known_as", "biography", "birthday", "deathday", "external_ids", "gender", "homepage", "id",
+        "imdb_id", "known_for_department", "name", "place_of_birth", "popularity", "profile_path",
+        combined_credits=fields(cast=CREDIT_ITEM, crew=CREDIT_ITEM),
+    )),
+    (re.compile(r"^(person/popular|search/person|trending/person/\w+)$"), fields(results=PERSON_ITEM, **PAGE)),
+    (re.compile(r"^(movie/[a-z_]+|discover/movie|search/movie|trending/movie/\w+)$"), fields(results=MOVIE_ITEM, **PAGE)),
+    (re.compile(r"^(tv/[a-z_]+|discover/tv|search/tv|trending/tv/\w+)$"), fields(results=SHOW_ITEM, **PAGE)),
+]
+OMDB_TITLE = fields("Error", "imdbID", "imdbRating", "imdbVotes", "Response", "Title", "Year")
+
+
+def projection(path: str) -> dict:
+    for pattern, spec in PROJECTIONS:
+        if pattern.match(path):
+            return spec
+    return None
+
+
+def project(value: object, spec: object) -> object:
+    if spec is True or spec is None:
+        return value
+    if isinstance(value, list):
+        return [project(item, spec) for item in value]
+    if isinstance(value, dict):
+        if "*" in spec:
+            return {key: project(item, spec["*"]) for key, item in value.items()}
+        return {key: project(value[key], item) for key, item in spec.items() if key in value}
+    return value
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from collections import deque
+from typing import Awaitable, Callable
+
+from pypoca.services import http
+
+
+class CandidatePool:
+    def __init__(self, load: Callable[[], Awaitable], *, low: int, high: int) -> None:
+        self.load = load
+        self.low = low
+        self.high = high
+        self._items = deque()
+        self._task = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def refilling(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def refill(self) -> None:
+        if not self.refilling and len(self) < self.high:
+            self._task = http.detach(self.fill())
+
+    async def fill(self) -> None:
+        while len(self) < self.high:
+            results = await asyncio.gather(*(self.load() for _ in range(self.high - len(self))), return_exceptions=True)
+            items = [result for result in results if result is not None and not isinstance(result, Exception)]
+            if not items:
+                return
+            self._items.extend(items)
+
+    def put(self, item: object) -> None:
+        self._items.appendleft(item)
+
+    async def take(self, accept: Callable[[object], bool] = lambda item: True) -> object:
+        try:
+            for _ in range(len(self)):
+                item = self._items.popleft()
+                if accept(item):
+                    return item
+                self._items.append(item)
+            while True:
+                item = await self.load()
+                if item is not None and accept(item):
+                    return item
+        finally:
+            if len(self) < self.low:
+                self.refill()
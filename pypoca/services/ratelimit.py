@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Mapping
+
+
+class RateLimiter:
+    def __init__(self, *, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.waiting = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return self.waiting
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def _block(self, seconds: float) -> None:
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        self._refill(now)
+        self.tokens -= 1
+        delay = max(0.0, self.blocked_until - now) + max(0.0, -self.tokens / self.rate)
+        if delay > 0:
+            self.waiting += 1
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self.waiting -= 1
+
+    def update(self, status: int, headers: Mapping[str, str]) -> None:
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is not None and remaining.isdigit():
+            self.tokens = min(self.tokens, float(remaining))
+        if status == 429:
+            self._block(self.seconds(headers.get("Retry-After")) or 1 / self.rate)
+        elif remaining == "0":
+            self._block(self.seconds(headers.get("X-RateLimit-Reset")))
+
+    @staticmethod
+    def seconds(value: str) -> float:
+        if not value:
+            return 0.0
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                return 0.0
+        if seconds > 1e9:
+            return max(0.0, seconds - time.time())
+        return max(0.0, seconds)
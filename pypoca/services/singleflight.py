@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from typing import Awaitable, Callable
+
+from pypoca.services import http
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._calls = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: tuple, function: Callable[[], Awaitable]) -> object:
+        task = self._calls.get(key)
+        if task is None:
+            task = http.detach(function())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(task)
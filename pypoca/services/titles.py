@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+import unicodedata
+from bisect import bisect_left, insort
+from collections import Counter
+
+from pypoca.config import TITLE_INDEX
+from pypoca.services import payload
+
+ITEMS = {
+    "movie": payload.MOVIE_ITEM,
+    "tv": payload.SHOW_ITEM,
+    "person": payload.PERSON_ITEM,
+}
+
+
+def normalize(text: str) -> str:
+    text = unicodedata.normalize("NFKD", text.casefold())
+    return " ".join("".join(char for char in text if not unicodedata.combining(char)).split())
+
+
+def suffixes(text: str) -> tuple[str, ...]:
+    words = text.split()
+    return tuple(" ".join(words[i:]) for i in range(len(words)))
+
+
+def trigrams(text: str) -> set[str]:
+    text = f"  {text} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def distance(a: str, b: str) -> int:
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        current = [i]
+        for j, y in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (x != y)))
+        previous = current
+    return previous[-1]
+
+
+class Entry:
+    __slots__ = ("label", "value", "popularity", "keys", "grams", "item")
+
+    def __init__(self, *, label: str, value: str, popularity: float, item: dict) -> None:
+        text = normalize(value)
+        self.label = label[:100]
+        self.value = value[:100]
+        self.popularity = popularity or 0.0
+        self.keys = suffixes(text)
+        self.grams = trigrams(text)
+        self.item = item
+
+    def distance(self, query: str) -> float:
+        return min(distance(query, key[:len(query)]) for key in self.keys) / max(len(query), 1)
+
+
+class TitleIndex:
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._keys = []
+        self._grams = {}
+        self._entries = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, id: int) -> bool:
+        return id in self._entries
+
+    def add(self, id: int, *, label: str, value: str, popularity: float = 0.0, item: dict = None) -> None:
+        if not value:
+            return
+        self.remove(id)
+        entry = Entry(label=label, value=value, popularity=popularity, item=item or {"id": id})
+        self._entries[id] = entry
+        for key in entry.keys:
+            insort(self._keys, (key, id))
+        for gram in entry.grams:
+            self._grams.setdefault(gram, set()).add(id)
+        while len(self._entries) > self.maxsize:
+            self.remove(next(iter(self._entries)))
+
+    def remove(self, id: int) -> None:
+        entry = self._entries.pop(id, None)
+        if entry is None:
+            return
+        for key in entry.keys:
+            index = bisect_left(self._keys, (key, id))
+            if index < len(self._keys) and self._keys[index] == (key, id):
+                del self._keys[index]
+        for gram in entry.grams:
+            ids = self._grams.get(gram)
+            ids.discard(id)
+            if not ids:
+                del self._grams[gram]
+
+    def prefix(self, prefix: str, *, limit: int = 25) -> list[Entry]:
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        ids = {}
+        index = bisect_left(self._keys, (prefix,))
+        while index < len(self._keys) and len(ids) < TITLE_INDEX["max_scan"]:
+            key, id = self._keys[index]
+            if not key.startswith(prefix):
+                break
+            ids[id] = key == prefix
+            index += 1
+        ranked = sorted(ids, key=lambda id: (not ids[id], -self._entries[id].popularity))
+        return [self._entries[id] for id in ranked[:limit]]
+
+    def fuzzy(self, query: str, *, limit: int = 20) -> list[Entry]:
+        query = normalize(query)
+        grams = trigrams(query) if query else set()
+        counts = Counter(id for gram in grams for id in self._grams.get(gram, ()))
+        candidates = [id for id, count in counts.most_common(TITLE_INDEX["max_scan"]) if count * 3 >= len(grams)]
+        scored = [(self._entries[id].distance(query), -self._entries[id].popularity, id) for id in candidates]
+        scored = sorted(score for score in scored if score[0] <= TITLE_INDEX["max_distance"])
+        return [self._entries[id] for _, _, id in scored[:limit]]
+
+
+class Titles:
+    def __init__(self, maxsize: int) -> None:
+        self.indexes = {media_type: TitleIndex(maxsize) for media_type in ITEMS}
+
+    def __len__(self) -> int:
+        return sum(len(index) for index in self.indexes.values())
+
+    def complete(self, media_type: str, prefix: str, *, limit: int = 25) -> dict[str, str]:
+        return {entry.label: entry.value for entry in self.indexes[media_type].prefix(prefix, limit=limit)}
+
+    def search(
+        self, media_type: str, query: str, *, include_adult: bool = False, year: int = None, limit: int = 20
+    ) -> list[dict]:
+        items = []
+        for entry in self.indexes[media_type].fuzzy(query, limit=TITLE_INDEX["max_scan"]):
+            date = entry.item.get("release_date") or entry.item.get("first_air_date") or ""
+            if entry.item.get("adult") and not include_adult:
+                continue
+            if year is not None and date[:4] != str(year):
+                continue
+            items.append(entry.item)
+            if len(items) == limit:
+                break
+        return items
+
+    def correct(self, media_type: str, query: str) -> str:
+        entries = self.indexes[media_type].fuzzy(query, limit=1)
+        return entries[0].value if entries else None
+
+    def add(self, media_type: str, item: dict) -> None:
+        if media_type not in self.indexes or "id" not in item or item.get("adult"):
+            return
+        value = item.get("title") or item.get("name")
+        date = item.get("release_date") or item.get("first_air_date") or ""
+        label = f"{value} ({date[:4]})" if date[:4] else value
+        self.indexes[media_type].add(
+            item["id"],
+            label=label or "",
+            value=value,
+            popularity=item.get("popularity"),
+            item={**payload.project(item, ITEMS[media_type]), "media_type": media_type},
+        )
+
+    def observe(self, path: str, result: dict) -> None:
+        if not isinstance(result, dict):
+            return
+        media_type = next((part for part in path.split("/") if part in ITEMS), None)
+        if isinstance(result.get("results"), list):
+            for item in result["results"]:
+                if isinstance(item, dict):
+                    self.add(item.get("media_type", media_type), item)
+        elif media_type and path.split("/")[-1].isdigit():
+            self.add(media_type, result)
+
+
+titles = Titles(maxsize=TITLE_INDEX["maxsize"])
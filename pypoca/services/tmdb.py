@@ -1,12 +1,24 @@
 # -*- coding: utf-8 -*-
+import asyncio
 import random
-from aiohttp import ClientSession
+import sqlite3
+import time
 
-from pypoca.config import TMDB_KEY
+from pypoca.config import TITLE_INDEX, TMDB_CACHE, TMDB_DISK_CACHE, TMDB_KEY
 from pypoca.exceptions import TmdbException
+from pypoca.log import log
+from pypoca.services import http, payload
+from pypoca.services.cache import DiskCache, TTLCache
+from pypoca.services.singleflight import SingleFlight
+from pypoca.services.titles import normalize, titles
 
 
 class TMDb:
+    cache = TTLCache(maxsize=TMDB_CACHE["maxsize"])
+    disk = DiskCache(path=TMDB_DISK_CACHE["path"], maxsize=TMDB_DISK_CACHE["maxsize"])
+    flights = SingleFlight()
+    upstream = http.Upstream("tmdb")
+
     def __init__(self, *, language: str = None, region: str = None):
         self.language = "en_US" if language is None else language
         self.region = "US" if region is None else region
@@ -32,6 +44,23 @@ class TMDb:
             "watch_region": self.region,
         }
 
+    def ttl(self, path: str) -> int:
+        if path.startswith(("genre/", "watch/providers/")):
+            return TMDB_CACHE["catalog_ttl"]
+        if path.startswith(("movie/", "tv/", "person/")) and path.split("/")[1].isdigit():
+            return TMDB_CACHE["details_ttl"]
+        return TMDB_CACHE["lists_ttl"]
+
+    def cache_key(self, path: str, params: dict) -> tuple:
+        return (path, tuple(sorted((k, str(v)) for k, v in params.items() if k != "api_key")))
+
+    def disk_key(self, path: str, params: dict) -> str:
+        entity, _, id = path.partition("/")
+        if entity not in ("movie", "tv", "person") or not id.isdigit():
+            return None
+        append = ",".join(sorted(str(params.get("append_to_response", "")).split(",")))
+        return f"{entity}:{id}:{params['language']}:{append}:{params.get('include_image_language', '')}"
+
     async def request(self, path: str, method: str = "GET", **kwargs) -> dict:
         url = f"{self.host}/{self.version}/{path}"
         params = {
@@ -41,15 +70,75 @@ class TMDb:
         }
         params = {**self.default_params, **params}
 
-        async with ClientSession() as session:
-            async with await session.request(method, url=url, params=params) as response:
-                try:
-                    response.raise_for_status()
-                    result = await response.json()
-                except Exception as e:
-                    raise TmdbException(e)
-                else:
-                    return result
+        if method != "GET":
+            return await self.fetch(method, url, params)
+
+        key = self.cache_key(path, params)
+        cached, stale = self.cache.lookup(key, max_stale=TMDB_CACHE["max_stale"])
+        if cached is not None and not stale:
+            return cached
+        if cached is not None and TMDB_CACHE["stale_while_revalidate"]:
+            http.detach(self.revalidate(key, path, method, url, params))
+            return {**cached, "stale": True}
+        try:
+            result = await self.flights.do(key, lambda: self.load(path, method, url, params, refresh=stale))
+        except TmdbException as e:
+            if cached is None or not http.is_transient(e):
+                raise
+            return {**cached, "stale": True}
+        self.cache.set(key, result, ttl=self.ttl(path))
+        return result
+
+    async def search_titles(self, media_type: str, query: str, **kwargs) -> dict:
+        path = f"search/{media_type}"
+        try:
+            response = await asyncio.wait_for(self.request(path, query=query, **kwargs), timeout=TITLE_INDEX["search_budget"])
+        except (TmdbException, asyncio.TimeoutError):
+            years = [kwargs.get(key) for key in ("year", "primary_release_year", "first_air_date_year")]
+            years = [year for year in years if year is not None and year > 0]
+            results = titles.search(
+                media_type, query, include_adult=bool(kwargs.get("include_adult")), year=years[0] if years else None
+            ) if kwargs.get("page", 1) == 1 else []
+            if not results:
+                raise
+            return {"page": 1, "results": results, "total_pages": 1, "total_results": len(results), "stale": True}
+        if not response.get("results") and kwargs.get("page", 1) == 1:
+            correction = titles.correct(media_type, query)
+            if correction and normalize(correction) != normalize(query):
+                return await self.request(path, query=correction, **kwargs)
+        return response
+
+    async def revalidate(self, key: tuple, path: str, method: str, url: str, params: dict) -> None:
+        try:
+            result = await self.flights.do(key, lambda: self.load(path, method, url, params, refresh=True))
+        except TmdbException:
+            return
+        self.cache.set(key, result, ttl=self.ttl(path))
+
+    async def load(self, path: str, method: str, url: str, params: dict, *, refresh: bool = False) -> dict:
+        disk_key = self.disk_key(path, params)
+        result = None if refresh or disk_key is None else await self.disk_call(self.disk.get, disk_key)
+        if result is None:
+            result = payload.project(await self.fetch(method, url, params), payload.projection(path))
+            result["fetched_on"] = time.time()
+            if disk_key is not None:
+                await self.disk_call(self.disk.set, disk_key, result, ttl=TMDB_DISK_CACHE["ttl"])
+        titles.observe(path, result)
+        return result
+
+    async def disk_call(self, method, *args, **kwargs) -> object:
+        try:
+            return await asyncio.to_thread(method, *args, **kwargs)
+        except sqlite3.Error as e:
+            log.warning(f"TMDb disk cache unavailable, skipping it. {e}")
+
+    async def fetch(self, method: str, url: str, params: dict) -> dict:
+        try:
+            async with http.client.request(method, url, upstream=self.upstream, params=params) as response:
+                response.raise_for_status()
+                return payload.loads(await response.read())
+        except Exception as e:
+            raise TmdbException(e)
 
 
 class Movies(TMDb):
@@ -142,11 +231,11 @@ class Movies(TMDb):
 
     async def providers(self) -> dict:
         """https://developers.themoviedb.org/3/watch-providers/get-movie-providers"""
-        return await self.request("watch/providers/movie", watch_region=self.region)
+        return await self.request("watch/providers/movie")
 
     async def search(self, query: str, *, page: int = 1, include_adult: bool = False, year: int = None, primary_release_year: int = None) -> dict:
         """https://developers.themoviedb.org/3/search/search-movies"""
-        return await self.request("search/movie", query=query, page=page, include_adult=include_adult, year=year, primary_release_year=primary_release_year)
+        return await self.search_titles("movie", query, page=page, include_adult=include_adult, year=year, primary_release_year=primary_release_year)
 
     async def top_rated(self, *, page: int = 1) -> dict:
         """https://developers.themoviedb.org/3/movies/get-top-rated-movies"""
@@ -233,7 +322,7 @@ class People(TMDb):
 
     async def search(self, query: str, *, page: int = 1, include_adult: bool = False) -> dict:
         """https://developers.themoviedb.org/3/search/search-people"""
-        return await self.request("search/person", query=query, page=page, include_adult=include_adult)
+        return await self.search_titles("person", query, page=page, include_adult=include_adult)
 
     async def trending(self, *, interval: str = "day", page: int = 1) -> dict:
         """https://developers.themoviedb.org/3/trending/get-trending"""
@@ -344,13 +433,13 @@ class Shows(TMDb):
         """https://developers.themoviedb.org/3/tv/get-popular-tv-shows"""
         return await self.request("tv/popular", page=page)
 
-    async def providers(self, *, watch_region=None) -> dict:
+    async def providers(self) -> dict:
         """https://developers.themoviedb.org/3/watch-providers/get-tv-providers"""
-        return await self.request("watch/providers/tv", watch_region=watch_region)
+        return await self.request("watch/providers/tv")
 
     async def search(self, query: str, *, page: int = 1, include_adult: bool = False, first_air_date_year: int = None) -> dict:
         """https://developers.themoviedb.org/3/search/search-tv-shows"""
-        return await self.request("search/tv", query=query, page=page, include_adult=include_adult, first_air_date_year=first_air_date_year)
+        return await self.search_titles("tv", query, page=page, include_adult=include_adult, first_air_date_year=first_air_date_year)
 
     async def top_rated(self, *, page: int = 1) -> dict:
         """https://developers.themoviedb.org/3/tv/get-top-rated-tv"""
@@ -1,11 +1,14 @@
 # -*- coding: utf-8 -*-
-from aiohttp import ClientSession
-
 from pypoca.config import TRAKT_CLIENT, TRAKT_SECRET
 from pypoca.exceptions import TraktException
+from pypoca.services import http, payload
+from pypoca.services.singleflight import SingleFlight
 
 
 class Trakt:
+    flights = SingleFlight()
+    upstream = http.Upstream("trakt")
+
     @property
     def host(self) -> str:
         return "https://api.trakt.tv"
@@ -33,16 +36,16 @@ class Trakt:
     async def request(self, path: str, method: str = "GET", **kwargs) -> dict:
         url = f"{self.host}/{path}"
         headers = self.default_headers
+        key = (method, path)
+        return await self.flights.do(key, lambda: self.fetch(method, url, headers))
 
-        async with ClientSession() as session:
-            async with await session.request(method, url=url, headers=headers) as response:
-                try:
-                    response.raise_for_status()
-                    result = await response.json()
-                except Exception as e:
-                    raise TmdbException(e)
-                else:
-                    return result
+    async def fetch(self, method: str, url: str, headers: dict) -> dict:
+        try:
+            async with http.client.request(method, url, upstream=self.upstream, headers=headers) as response:
+                response.raise_for_status()
+                return payload.loads(await response.read())
+        except Exception as e:
+            raise TraktException(e)
 
 
 class Movie(Trakt):
@@ -1,7 +1,49 @@
 # -*- coding: utf-8 -*-
+import asyncio
+import re
+
 from deep_translator import GoogleTranslator
 
+from pypoca.config import TRANSLATION_CACHE
+from pypoca.services.cache import TTLCache
+from pypoca.services.singleflight import SingleFlight
+
+WORDS = re.compile(r"[^\W\d_]+", re.UNICODE)
+ENGLISH = frozenset(
+    [
+        "a", "about", "after", "an", "and", "are", "as", "at", "be", "by", "for", "from", "gets", "has", "he",
+        "her", "his", "in", "into", "is", "it", "its", "of", "on", "one", "she", "that", "the", "their", "them",
+        "they", "to", "who", "with", "while", "when", "where", "movie", "film", "guy", "man", "woman", "girl",
+    ]
+)
+
+
+def normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+def is_english(text: str) -> bool:
+    words = [word.lower() for word in WORDS.findall(text)]
+    if not words or not all(word.isascii() for word in words):
+        return False
+    hits = sum(word in ENGLISH for word in words)
+    return hits >= min(2, len(words)) and hits / len(words) >= 0.15
+
 
 class Translator:
-    def translate(self, text: str, source: str = "auto", target: str = "en") -> str:
+    cache = TTLCache(maxsize=TRANSLATION_CACHE["maxsize"])
+    flights = SingleFlight()
+
+    async def translate(self, text: str, source: str = "auto", target: str = "en") -> str:
+        text = normalize(text)
+        if target == "en" and source in ("auto", "en") and is_english(text):
+            return text
+        key = (text.casefold(), source, target)
+        result = self.cache.get(key)
+        if result is None:
+            result = await self.flights.do(key, lambda: asyncio.to_thread(self.fetch, text, source, target))
+            self.cache.set(key, result, ttl=TRANSLATION_CACHE["ttl"])
+        return result
+
+    def fetch(self, text: str, source: str, target: str) -> str:
         return GoogleTranslator(source=source, target=target).translate(text)
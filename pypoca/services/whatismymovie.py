@@ -1,10 +1,46 @@
 # -*- coding: utf-8 -*-
-from aiohttp import ClientSession
+import codecs
+from html.parser import HTMLParser
 
+from aiohttp import ClientResponse
+
+from pypoca.config import WHATISMYMOVIE_CACHE
 from pypoca.exceptions import NoResults, WhatIsMyMovieException
+from pypoca.services import http
+from pypoca.services.cache import TTLCache
+from pypoca.services.singleflight import SingleFlight
+
+
+class ResultParser(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.parts = None
+        self.title = None
+
+    def close_title(self) -> None:
+        if self.parts is not None:
+            self.title = "".join(self.parts).strip() or None
+            self.parts = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple]) -> None:
+        self.close_title()
+        if self.title is None and tag == "a" and "item?item" in (dict(attrs).get("href") or ""):
+            self.parts = []
+
+    def handle_endtag(self, tag: str) -> None:
+        self.close_title()
+
+    def handle_data(self, data: str) -> None:
+        if self.parts is not None:
+            self.parts.append(data)
 
 
-class Trakt:
+class WhatIsMyMovie:
+    cache = TTLCache(maxsize=WHATISMYMOVIE_CACHE["maxsize"])
+    misses = TTLCache(maxsize=WHATISMYMOVIE_CACHE["maxsize"])
+    flights = SingleFlight()
+    upstream = http.Upstream("whatismymovie")
+
     @property
     def host(self) -> str:
         return "https://www.whatismymovie.com"
@@ -12,29 +48,40 @@ class Trakt:
     async def request(self, path: str, method: str = "GET", **kwargs) -> str:
         url = f"{self.host}/{path}"
         params = kwargs
+        key = (method, path, tuple(sorted((k, " ".join(str(v).casefold().split())) for k, v in params.items())))
+        result = self.cache.get(key)
+        if result is not None:
+            return result
+        if key in self.misses:
+            raise NoResults()
+        result = await self.flights.do(key, lambda: self.fetch(method, url, params))
+        if result is None:
+            self.misses.set(key, True, ttl=WHATISMYMOVIE_CACHE["negative_ttl"])
+            raise NoResults()
+        self.cache.set(key, result, ttl=WHATISMYMOVIE_CACHE["ttl"])
+        return result
 
-        async with ClientSession() as session:
-            async with session.request(method, url=url, params=params) as response:
-                try:
-                    response.raise_for_status()
-                    result = str(await response.read())
-                except Exception as e:
-                    raise WhatIsMyMovieException(e)
-                else:
-                    return result
+    async def fetch(self, method: str, url: str, params: dict) -> str:
+        try:
+            async with http.client.request(method, url, upstream=self.upstream, params=params) as response:
+                response.raise_for_status()
+                return await self.parse(response)
+        except Exception as e:
+            raise WhatIsMyMovieException(e)
 
+    @staticmethod
+    async def parse(response: ClientResponse) -> str:
+        parser = ResultParser()
+        decoder = codecs.getincrementaldecoder(response.charset or "utf-8")(errors="replace")
+        size = 0
+        async for chunk in response.content.iter_chunked(8192):
+            size += len(chunk)
+            parser.feed(decoder.decode(chunk))
+            if parser.title is not None or size >= WHATISMYMOVIE_CACHE["max_bytes"]:
+                break
+        return parser.title
 
-class Movie(Trakt):
+
+class Movie(WhatIsMyMovie):
     async def name_by_overview(self, query: str) -> str:
-        response = await self.request(f"results", text=query)
-        try:
-            index = response.find("item?item")
-            assert index != -1
-            text = response[index:index+150]
-            init = text.find(">")
-            end = text[init:].find("<")
-            assert init != end
-        except Exception:
-            raise NoResults()
-        else:
-            return text[init + 1:init + end]
+        return await self.request("results", text=query)